@@ -11,7 +11,6 @@ Usage:
     python add_to_tracker.py 004
 """
 
-import json
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -19,7 +18,8 @@ from datetime import datetime
 # Import centralized utilities
 sys.path.append(str(Path(__file__).parent))
 from config.paths import VIDEO_TRACKER_FILE, LANGUAGES, ACTIVE_LANGUAGES, LANG_DIR_MAP
-from lib.story_utils import find_story_files, extract_title, load_story
+from lib.story_utils import find_story_files, title_from_story, load_story
+from lib.jsonl_utils import load_json, save_json
 
 def main():
     if len(sys.argv) < 2:
@@ -39,8 +39,7 @@ def main():
     print("=" * 70)
     
     # Load tracker
-    with open(VIDEO_TRACKER_FILE, 'r', encoding='utf-8') as f:
-        tracker_data = json.load(f)
+    tracker_data = load_json(VIDEO_TRACKER_FILE)
     
     # Find story files
     print(f"\n🔍 Searching for story files...")
@@ -52,15 +51,14 @@ def main():
     
     print(f"✅ Found {len(story_files)} language versions")
     
+    now = datetime.now().isoformat()
     for file_lang, file_path in story_files.items():
         lang_code = LANG_DIR_MAP.get(file_lang, file_lang)
         video_id = f"{story_number}_{lang_code}"
         
-        # Get title
-        title = provided_title or extract_title(file_path)
-        
-        # Read story for metadata
+        # Read story once for both the title and metadata
         story_data = load_story(file_path)
+        title = provided_title or title_from_story(story_data)
         
         tracker_data[video_id] = {
             "video_id": video_id,
@@ -69,9 +67,9 @@ def main():
             "source_learning_id": story_data.get('source_learning_id', 'unknown'),
             "story_file": str(file_path).replace('/', '\\'),
             "status": "script_ready",
-            "created_at": datetime.now().isoformat(),
+            "created_at": now,
             "estimated_duration": story_data.get('estimated_duration', 208),
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now
         }
         
         print(f"\n✅ {video_id}:")
@@ -79,8 +77,7 @@ def main():
         print(f"   {lang_name}: {title[:60]}...")
     
     # Save
-    with open(VIDEO_TRACKER_FILE, 'w', encoding='utf-8') as f:
-        json.dump(tracker_data, f, indent=2, ensure_ascii=False)
+    save_json(tracker_data, VIDEO_TRACKER_FILE, pretty=False)
     
     print(f"\n{'='*70}")
     print(f"✅ Added {len(story_files)} videos to tracker")
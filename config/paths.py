@@ -12,6 +12,7 @@ DATA_DIR = BASE_DIR / "data"
 CONFIG_DIR = BASE_DIR / "config"
 PROMPTS_DIR = BASE_DIR / "prompts"
 LIB_DIR = BASE_DIR / "lib"
+CACHE_DIR = BASE_DIR / ".cache"
 
 # Data subdirectories
 STORIES_DIR = DATA_DIR / "stories"
@@ -19,6 +20,11 @@ LEARNINGS_DIR = DATA_DIR / "learnings"
 VIDEOS_DIR = DATA_DIR / "videos"
 TAFSIR_DIR = DATA_DIR / "tafsir"
 
+# Cache subdirectories (safe to delete, rebuilt on demand)
+STORY_CACHE_DIR = CACHE_DIR / "stories"
+STORY_INDEX_FILE = CACHE_DIR / "story_index.json"
+TRANSLATION_CACHE_DIR = CACHE_DIR / "translations"
+
 # Story language directories
 STORY_DIRS = {
     'en': STORIES_DIR / "en",
@@ -10,7 +10,7 @@ sys.path.append('lib')
 sys.path.append('lib/video_tools')
 
 from optimized_thumbnail_generator import OptimizedThumbnailGenerator
-import shutil
+from file_utils import fast_clone
 
 def generate_optimized_production_thumbnails():
     """Generate optimized thumbnails for all production videos"""
@@ -124,7 +124,7 @@ def setup_optimized_universal_strategy(source_thumbnail_path):
         target_file = os.path.join(lang_dir, f"story_001_{lang}_optimized_thumbnail.png")
         
         try:
-            shutil.copy2(source_thumbnail_path, target_file)
+            fast_clone(source_thumbnail_path, target_file)
             print(f"✅ {lang.upper()}: Copied optimized thumbnail")
         except Exception as e:
             print(f"❌ {lang.upper()}: Failed to copy - {e}")
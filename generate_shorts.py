@@ -22,7 +22,7 @@ import hashlib
 
 # Add lib to path
 sys.path.append(str(Path(__file__).parent / "lib"))
-from llm_tools import create_default_manager
+from llm_tools import get_default_manager
 
 # Import centralized utilities
 sys.path.append(str(Path(__file__).parent))
@@ -131,7 +131,7 @@ def generate_short(story_data: dict, short_type: str) -> tuple:
     prompt = prompt.replace("{story_content}", story_content)
     
     # Generate short
-    llm = create_default_manager()
+    llm = get_default_manager()
     
     print(f"\n⏳ Generating {type_info['name']} Short...")
     response = llm.generate(prompt=prompt)
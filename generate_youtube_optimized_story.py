@@ -12,7 +12,7 @@ import hashlib
 
 # Add lib to path
 sys.path.append(str(Path(__file__).parent / "lib"))
-from llm_tools import create_default_manager
+from llm_tools import get_default_manager
 
 # Import centralized utilities
 sys.path.append(str(Path(__file__).parent))
@@ -74,7 +74,7 @@ def generate_youtube_optimized_story():
         story_prompt = story_prompt + get_character_exclusion_text(used_chars)
     
     # Generate story
-    llm = create_default_manager()
+    llm = get_default_manager()
     
     print(f"\n⏳ Generating story...")
     story_response = llm.generate(prompt=story_prompt)
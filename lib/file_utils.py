@@ -0,0 +1,32 @@
+import os
+import shutil
+
+
+def list_files(directory: str) -> set:
+    """Return the names of files in a directory (empty if it doesn't exist)."""
+    if not os.path.isdir(directory):
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def fast_clone(src: str, dst: str):
+    """Make dst a copy of src, hardlinking when the filesystem allows it.
+
+    A hardlink shares the source's data, so only use this for files that
+    are never edited in place (e.g. universal thumbnails). Falls back to
+    shutil.copy2 across volumes or on filesystems without link support.
+    The clone is made under a temporary sibling name and renamed over
+    dst, so a failed link or copy never leaves dst missing.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return  # Already the same file (same path or an existing hardlink)
+
+    tmp_path = f"{dst}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
@@ -1,17 +1,101 @@
 import json
+import mmap
+import os
 
-from typing import List, Dict
+from typing import Any, Dict, Iterator, List, Optional
 
-def load_jsonl(file_path: str) -> List[Dict]:
-    """Load all records from a JSONL file into a list."""
+# Optional fast JSON backend - falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def iter_jsonl(file_path: str) -> Iterator[Dict]:
+    """Yield records from a JSONL file one line at a time."""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return [json.loads(line) for line in f if line.strip()]
+        with open(file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
     except FileNotFoundError:
-        return []
+        return
+
+def find_jsonl_record(file_path: str, field: str, value: str) -> Optional[Dict]:
+    """Find the first JSONL record whose field equals value.
+    
+    The file is memory-mapped and searched for the encoded value as raw
+    bytes, so only lines that contain it are decoded and parsed.
+    """
+    needle = json.dumps(value, ensure_ascii=False).encode('utf-8')
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(needle)
+                while pos != -1:
+                    start = mm.rfind(b'\n', 0, pos) + 1
+                    end = mm.find(b'\n', pos)
+                    if end == -1:
+                        end = len(mm)
+                    try:
+                        record = parse_json(mm[start:end])
+                        if record.get(field) == value:
+                            return record
+                    except ValueError:
+                        pass
+                    pos = mm.find(needle, end)
+    except FileNotFoundError:
+        pass
+    return None
+
+def load_jsonl(file_path: str) -> List[Dict]:
+    """Load all records from a JSONL file into a list."""
+    return list(iter_jsonl(file_path))
 
 def save_jsonl(data: List[Dict], file_path: str):
-    """Save data to a JSONL file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        for item in data:
-            f.write(json.dumps(item, ensure_ascii=False) + '\n')
\ No newline at end of file
+    """Save data to a JSONL file, replacing it atomically in one write."""
+    payload = ''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in data)
+    _write_atomic(payload.encode('utf-8'), file_path)
+
+def append_jsonl(record: Dict, file_path: str):
+    """Append a single record to a JSONL file."""
+    with open(file_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def parse_json(raw: bytes) -> Any:
+    """Parse a JSON document from bytes, using orjson when it is installed."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def load_json(file_path: str) -> Any:
+    """Load a JSON document, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        return parse_json(f.read())
+
+def save_json(data: Any, file_path: str, pretty: bool = True):
+    """Save data as UTF-8 JSON, using orjson when it is installed.
+    
+    Output is indented by default; pass pretty=False for compact output
+    in machine-read files. The file is written to a temporary sibling,
+    flushed to disk and renamed into place, so readers never see a
+    partially written document.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        payload = orjson.dumps(data, option=option)
+    elif pretty:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    _write_atomic(payload, file_path)
+
+def _write_atomic(payload: bytes, file_path: str):
+    """Write bytes to a temporary sibling, fsync it and rename into place."""
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
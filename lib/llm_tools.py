@@ -8,10 +8,13 @@ import os
 import json
 import time
 import logging
+import itertools
+import threading
 from typing import Dict, List, Optional, Union, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import hashlib
+from functools import lru_cache
 
 # Load environment variables from .env file
 try:
@@ -63,12 +66,35 @@ class LLMProvider:
     def __init__(self, config: LLMConfig):
         self.config = config
         self.logger = logging.getLogger(f"llm.{config.provider}")
+        self._client_lock = threading.Lock()
         self._setup_client()
     
     def _setup_client(self):
         """Setup provider-specific client."""
         raise NotImplementedError
     
+    def _api_keys(self, env_var: str) -> List[str]:
+        """API keys to use: the configured key, else the comma-separated
+        pool in <env_var>S (e.g. OPENAI_API_KEYS), else <env_var> itself."""
+        if self.config.api_key:
+            return [self.config.api_key]
+        keys = [key.strip() for key in os.getenv(f"{env_var}S", "").split(",") if key.strip()]
+        if not keys and os.getenv(env_var):
+            keys = [os.getenv(env_var)]
+        return keys
+    
+    def _set_clients(self, clients: List[Any]):
+        """Use these clients (one per API key) in round-robin order."""
+        self.clients = clients
+        self.client = clients[0]
+        self._client_cycle = itertools.cycle(clients)
+    
+    def _next_client(self) -> Any:
+        """Next client in the rotation, so concurrent requests spread their
+        load across every key's rate limit."""
+        with self._client_lock:
+            return next(self._client_cycle)
+    
     def generate(self, prompt: str, **kwargs) -> LLMResponse:
         """Generate response from LLM."""
         raise NotImplementedError
@@ -96,24 +122,28 @@ class OpenAIProvider(LLMProvider):
         if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI package not available. Install with: pip install openai")
         
-        api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+        api_keys = self._api_keys("OPENAI_API_KEY")
+        if not api_keys:
+            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY (or a comma-separated OPENAI_API_KEYS) environment variable.")
         
-        self.client = openai.OpenAI(api_key=api_key)
+        self._set_clients([openai.OpenAI(api_key=api_key) for api_key in api_keys])
     
     def generate(self, prompt: str, **kwargs) -> LLMResponse:
-        """Generate response using OpenAI API."""
+        """Generate response using OpenAI API.
+        
+        max_tokens and timeout may be passed to override the config for
+        a single request.
+        """
         start_time = time.time()
         prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:12]
         
         try:
-            response = self.client.chat.completions.create(
+            response = self._next_client().chat.completions.create(
                 model=self.config.model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.config.max_tokens,
+                max_tokens=kwargs.pop('max_tokens', self.config.max_tokens),
                 temperature=self.config.temperature,
-                timeout=self.config.timeout,
+                timeout=kwargs.pop('timeout', self.config.timeout),
                 **kwargs
             )
             
@@ -148,21 +178,24 @@ class AnthropicProvider(LLMProvider):
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("Anthropic package not available. Install with: pip install anthropic")
         
-        api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable.")
+        api_keys = self._api_keys("ANTHROPIC_API_KEY")
+        if not api_keys:
+            raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY (or a comma-separated ANTHROPIC_API_KEYS) environment variable.")
         
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self._set_clients([anthropic.Anthropic(api_key=api_key) for api_key in api_keys])
     
     def generate(self, prompt: str, **kwargs) -> LLMResponse:
-        """Generate response using Anthropic API."""
+        """Generate response using Anthropic API.
+        
+        max_tokens may be passed to override the config for a single request.
+        """
         start_time = time.time()
         prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:12]
         
         try:
-            response = self.client.messages.create(
+            response = self._next_client().messages.create(
                 model=self.config.model,
-                max_tokens=self.config.max_tokens,
+                max_tokens=kwargs.pop('max_tokens', self.config.max_tokens),
                 temperature=self.config.temperature,
                 messages=[{"role": "user", "content": prompt}],
                 **kwargs
@@ -310,7 +343,7 @@ class LLMManager:
                 'timestamp': datetime.now().isoformat()
             }, f, indent=2)
 
-def create_default_manager() -> LLMManager:
+def create_default_manager(cache_responses: bool = True) -> LLMManager:
     """Create a default LLM manager with sensible defaults."""
     
     # Try OpenAI first
@@ -336,7 +369,20 @@ def create_default_manager() -> LLMManager:
     except ImportError:
         print("💡 Using OpenAI only. Install anthropic for fallback: pip install anthropic")
     
-    return LLMManager(primary_config, fallback_config)
+    return LLMManager(primary_config, fallback_config, cache_responses=cache_responses)
+
+@lru_cache(maxsize=1)
+def get_default_manager() -> LLMManager:
+    """Process-wide default LLM manager, created on first use.
+    
+    Reusing one manager keeps the provider clients (and their connection
+    pools) alive across calls instead of rebuilding them per request.
+    In-memory response caching is off: story and shorts generation want a
+    fresh reply for a repeated prompt, and a process-lifetime cache would
+    grow without bound. Callers that do want replays (e.g. translation)
+    keep their own cache.
+    """
+    return create_default_manager(cache_responses=False)
 
 # Usage example for testing
 if __name__ == "__main__":
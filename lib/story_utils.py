@@ -4,21 +4,33 @@ Centralized utilities for story management.
 Handles file operations, character tracking, and common patterns.
 """
 
+import hashlib
 import json
+import os
+import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 
 # Import centralized config
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config.paths import STORIES_DIR, STORY_DIRS, LANGUAGES, ACTIVE_LANGUAGES
+from config.paths import STORIES_DIR, STORY_DIRS, LANGUAGES, ACTIVE_LANGUAGES, STORY_CACHE_DIR, STORY_INDEX_FILE
+from lib.jsonl_utils import find_jsonl_record, load_json, parse_json, save_json
+
+# Worker threads used to read story files during a full scan
+SCAN_WORKERS = 16
 
 
 def find_story(story_id: str) -> Tuple[Optional[Path], Optional[Dict]]:
     """
-    Find a story file by ID across all language directories.
+    Find a story file by ID across all language directories, falling back
+    to the records in stories.jsonl.
+    
+    Successful file lookups are remembered in an index under .cache, so looking
+    up the same ID again reads a single file instead of scanning the tree.
     
     Args:
         story_id: Story identifier (can be hash, number, or filename)
@@ -26,22 +38,108 @@ def find_story(story_id: str) -> Tuple[Optional[Path], Optional[Dict]]:
     Returns:
         Tuple of (file_path, story_data) or (None, None) if not found
     """
-    # Search in all story directories
-    for json_file in STORIES_DIR.rglob("*.json"):
+    index = _load_story_index()
+    if story_id in index:
+        indexed_file = STORIES_DIR / index[story_id]
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Check various ID fields
-                if (data.get('id') == story_id or 
-                    story_id in str(json_file.name) or
-                    data.get('video_id', '').startswith(story_id)):
-                    return json_file, data
-        except (json.JSONDecodeError, IOError):
-            continue
+            data = load_json(indexed_file)
+            if (story_id in indexed_file.name or
+                data.get('id') == story_id or
+                data.get('video_id', '').startswith(story_id)):
+                return indexed_file, data
+        except (ValueError, OSError):
+            pass  # Stale entry, fall back to a full scan
+    
+    json_file, data = _scan_for_story(story_id)
+    if not json_file:
+        # Universal stories may only exist as records in stories.jsonl
+        stories_jsonl = STORIES_DIR / "stories.jsonl"
+        data = find_jsonl_record(stories_jsonl, 'id', story_id)
+        return (stories_jsonl, data) if data else (None, None)
+    
+    index[story_id] = json_file.relative_to(STORIES_DIR).as_posix()
+    try:
+        STORY_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_json(index, STORY_INDEX_FILE)
+    except OSError:
+        pass  # Indexing is best-effort
+    return json_file, data
+
+
+def _load_story_index() -> Dict[str, str]:
+    """Load the story ID -> relative path index, or an empty one."""
+    try:
+        return load_json(STORY_INDEX_FILE)
+    except (ValueError, OSError):
+        return {}
+
+
+def _scan_for_story(story_id: str) -> Tuple[Optional[Path], Optional[Dict]]:
+    """
+    Scan every story file for one matching the given ID.
+    
+    Filename matches need no I/O, so they are checked first. The remaining
+    files are read on a thread pool, keeping the first match in scan order
+    and cancelling the reads still queued behind it.
+    """
+    json_files = list(STORIES_DIR.rglob("*.json"))
+    for json_file in json_files:
+        if story_id in json_file.name:
+            try:
+                return json_file, load_json(json_file)
+            except (ValueError, OSError):
+                continue
+    
+    # The ID fields can only match if the raw bytes hold an "id" equal to,
+    # or a "video_id" starting with, the ID, so skip parsing any file that
+    # doesn't (a bare substring would also hit IDs mentioned in content)
+    encoded_id = re.escape(json.dumps(story_id, ensure_ascii=False)[1:-1].encode('utf-8'))
+    id_field_pattern = re.compile(rb'"(?:id"\s*:\s*"' + encoded_id + rb'"|video_id"\s*:\s*"' + encoded_id + rb')')
+    
+    def check(json_file: Path) -> Optional[Dict]:
+        try:
+            with open(json_file, 'rb') as f:
+                raw = f.read()
+            if not id_field_pattern.search(raw):
+                return None
+            data = parse_json(raw)
+        except (ValueError, OSError):
+            return None
+        
+        # Check various ID fields
+        if (data.get('id') == story_id or 
+            data.get('video_id', '').startswith(story_id)):
+            return data
+        return None
+    
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for json_file, data in zip(json_files, executor.map(check, json_files)):
+            if data is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                return json_file, data
     
     return None, None
 
 
+def iter_json_files(dir_path: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries for the JSON files directly inside a directory.
+    
+    Uses os.scandir so callers can filter on entry.name without building
+    Path objects or issuing an extra stat per file.
+    
+    Args:
+        dir_path: Directory to scan
+    
+    Yields:
+        os.DirEntry for each *.json file
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                yield entry
+
+
 def find_story_files(story_number: str) -> Dict[str, Path]:
     """
     Find all language versions of a story by number.
@@ -83,13 +181,58 @@ def load_story(file_path: Path) -> Optional[Dict]:
         Story data dictionary or None if error
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(file_path)
     except (json.JSONDecodeError, IOError) as e:
         print(f"❌ Error loading {file_path}: {e}")
         return None
 
 
+def load_story_cached(file_path: Path, stat_result: Optional[os.stat_result] = None) -> Dict:
+    """
+    Load a story JSON file, reusing a parsed copy from the on-disk cache.
+    
+    Each story has one cache entry, named after its path and holding the
+    mtime and size it was parsed at. Editing a story invalidates the entry,
+    and re-caching overwrites it in place, so no stale entries pile up.
+    
+    Args:
+        file_path: Path to the JSON file
+        stat_result: Stat of the file if the caller already has one
+            (e.g. from os.DirEntry.stat()), to avoid stating it again
+    
+    Returns:
+        Story data dictionary
+    
+    Raises:
+        OSError, ValueError: if the story file cannot be read or parsed
+    """
+    file_path = Path(file_path)
+    st = stat_result or file_path.stat()
+    key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16).hexdigest()
+    cache_file = STORY_CACHE_DIR / f"{key}.pickle"
+    
+    try:
+        cached_mtime, cached_size, story_data = pickle.loads(cache_file.read_bytes())
+        if cached_mtime == st.st_mtime_ns and cached_size == st.st_size:
+            return story_data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # Missing, corrupt or old-format entry
+    
+    story_data = load_json(file_path)
+    
+    try:
+        STORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps(
+            (st.st_mtime_ns, st.st_size, story_data), protocol=pickle.HIGHEST_PROTOCOL
+        ))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return story_data
+
+
 def save_story(file_path: Path, story_data: Dict) -> bool:
     """
     Save a story to a JSON file with error handling.
@@ -105,8 +248,7 @@ def save_story(file_path: Path, story_data: Dict) -> bool:
         # Ensure directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(story_data, f, indent=2, ensure_ascii=False)
+        save_json(story_data, file_path)
         return True
     except IOError as e:
         print(f"❌ Error saving {file_path}: {e}")
@@ -123,7 +265,19 @@ def extract_title(file_path: Path) -> str:
     Returns:
         Extracted title or "Untitled"
     """
-    story_data = load_story(file_path)
+    return title_from_story(load_story(file_path))
+
+
+def title_from_story(story_data: Optional[Dict]) -> str:
+    """
+    Extract title from already-loaded story data.
+    
+    Args:
+        story_data: Story data dictionary (or None)
+    
+    Returns:
+        Extracted title or "Untitled"
+    """
     if not story_data:
         return "Untitled"
     
@@ -337,9 +491,12 @@ def format_story_preview(story_data: Dict, max_length: int = 500) -> str:
 __all__ = [
     'find_story',
     'find_story_files',
+    'iter_json_files',
     'load_story',
+    'load_story_cached',
     'save_story',
     'extract_title',
+    'title_from_story',
     'extract_character_info',
     'extract_used_characters',
     'get_character_exclusion_text',
@@ -202,6 +202,11 @@ CRITICAL INSTRUCTIONS:
             
             translated_data['translation_metadata']['estimated_cost'] = estimated_cost
             
+            # Score the script once here so callers can reuse the metrics
+            translated_data['translation_metadata']['quality_metrics'] = self.validate_script_quality(
+                self.extract_clean_script(translated_data), target_language
+            )
+            
             logger.info(f"Translation completed. Estimated cost: ${estimated_cost:.4f}")
             
             return translated_data
@@ -16,6 +16,10 @@ from datetime import datetime
 import logging
 from PIL import Image, ImageDraw, ImageFont
 import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -23,6 +27,16 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Environment variable holding each provider's API key
+PROVIDER_API_KEY_ENV = {
+    'openai': 'OPENAI_API_KEY',
+    'stability': 'STABILITY_API_KEY',
+    'gemini': 'GEMINI_API_KEY'
+}
+
+# HTTP statuses worth retrying: timeouts, rate limits and transient server errors
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
 @dataclass
 class ThumbnailConfig:
     """Configuration for thumbnail generation."""
@@ -45,6 +59,33 @@ class ThumbnailConfig:
     primary_provider: str = "openai"     # openai, stability, gemini
     fallback_providers: List[str] = None
     max_retries: int = 3
+    max_concurrent_requests: int = 4  # Parallel provider calls in batch mode
+
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate to a provider."""
+    
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate_per_second
+            
+            time.sleep(wait_time)
 
 class ThumbnailGenerator:
     """Multi-provider AI thumbnail generator for video content."""
@@ -57,9 +98,9 @@ class ThumbnailGenerator:
         self.thumbnails_path.mkdir(parents=True, exist_ok=True)
         
         # API keys from environment
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.stability_api_key = os.getenv('STABILITY_API_KEY')
-        self.gemini_api_key = os.getenv('GEMINI_API_KEY')
+        self.openai_api_key = os.getenv(PROVIDER_API_KEY_ENV['openai'])
+        self.stability_api_key = os.getenv(PROVIDER_API_KEY_ENV['stability'])
+        self.gemini_api_key = os.getenv(PROVIDER_API_KEY_ENV['gemini'])
         
         # Language-specific visual elements
         self.language_styles = {
@@ -94,22 +135,37 @@ class ThumbnailGenerator:
             "openai": {
                 "available": bool(self.openai_api_key),
                 "cost_per_image": 0.040,  # DALL-E 3 standard
+                "requests_per_second": 100,
+                "burst": 20,
                 "quality": "high",
                 "best_for": "photorealistic, detailed"
             },
             "stability": {
                 "available": bool(self.stability_api_key),
                 "cost_per_image": 0.020,  # Stable Diffusion
+                "requests_per_second": 15,
+                "burst": 5,
                 "quality": "good",
                 "best_for": "artistic, illustrations"
             },
             "gemini": {
                 "available": bool(self.gemini_api_key),
                 "cost_per_image": 0.000,  # Free tier available
+                "requests_per_second": 2,
+                "burst": 2,
                 "quality": "medium",
                 "best_for": "simple, concept-based"
             }
         }
+        
+        # Shared HTTP session so provider calls reuse connections
+        self.session = requests.Session()
+        
+        # Per-provider rate limiters, shared by all batch workers
+        self.rate_limiters = {
+            provider: TokenBucket(config['requests_per_second'], config['burst'])
+            for provider, config in self.providers.items()
+        }
     
     def generate_thumbnail_prompt(self, story_data: Dict, language: str) -> str:
         """Generate optimized prompt for thumbnail creation."""
@@ -185,6 +241,30 @@ The thumbnail should immediately convey the transformative and inspiring nature
         else:
             return 'person in contemplative moment, soft lighting, hopeful atmosphere'
     
+    def _post_with_retry(self, provider: str, url: str, headers: Dict, data: Dict) -> requests.Response:
+        """POST to a provider, retrying transient failures with exponential backoff."""
+        attempts = max(1, self.config.max_retries)
+        
+        for attempt in range(attempts):
+            self.rate_limiters[provider].acquire()
+            try:
+                response = self.session.post(url, headers=headers, json=data, timeout=60)
+                transient = response.status_code in TRANSIENT_STATUS_CODES or (
+                    response.status_code >= 400
+                    and any(marker in response.text.lower() for marker in ('rate limit', 'quota'))
+                )
+                if not transient or attempt == attempts - 1:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == attempts - 1:
+                    raise
+                reason = str(e)
+            
+            wait_time = min(30, 2 ** attempt) + random.uniform(0, 1)  # Exponential backoff with jitter
+            logger.warning(f"Attempt {attempt + 1} failed ({reason}), retrying in {wait_time:.1f}s")
+            time.sleep(wait_time)
+    
     def generate_with_openai(self, prompt: str) -> Optional[bytes]:
         """Generate thumbnail using OpenAI DALL-E 3."""
         if not self.openai_api_key:
@@ -206,11 +286,11 @@ The thumbnail should immediately convey the transformative and inspiring nature
                 'response_format': 'b64_json'
             }
             
-            response = requests.post(
+            response = self._post_with_retry(
+                'openai',
                 'https://api.openai.com/v1/images/generations',
-                headers=headers,
-                json=data,
-                timeout=60
+                headers,
+                data
             )
             
             if response.status_code == 200:
@@ -246,11 +326,11 @@ The thumbnail should immediately convey the transformative and inspiring nature
                 'steps': 30
             }
             
-            response = requests.post(
+            response = self._post_with_retry(
+                'stability',
                 'https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image',
-                headers=headers,
-                json=data,
-                timeout=60
+                headers,
+                data
             )
             
             if response.status_code == 200:
@@ -394,32 +474,52 @@ The thumbnail should immediately convey the transformative and inspiring nature
         return str(filepath)
     
     def generate_batch_thumbnails(self, stories_batch: List[Dict]) -> Dict[str, str]:
-        """Generate thumbnails for a batch of stories."""
+        """Generate thumbnails for a batch of stories.
+        
+        Provider calls are network-bound, so stories are generated concurrently
+        with at most ``config.max_concurrent_requests`` requests in flight.
+        Single-story batches run inline without starting a worker pool.
+        """
         results = {}
         total_cost = 0
         
-        for story_info in stories_batch:
+        def generate_one(story_info: Dict) -> Tuple[str, Optional[str]]:
+            video_id = story_info['video_id']
             try:
-                thumbnail_path = self.generate_thumbnail(
+                return video_id, self.generate_thumbnail(
                     story_info['story_data'],
                     story_info['language'],
-                    story_info['video_id']
+                    video_id
                 )
-                
-                if thumbnail_path:
-                    results[story_info['video_id']] = thumbnail_path
-                    # Add to cost tracking
-                    provider_used = self.config.primary_provider
-                    total_cost += self.providers[provider_used]['cost_per_image']
-                
             except Exception as e:
-                logger.error(f"Failed to generate thumbnail for {story_info['video_id']}: {e}")
+                logger.error(f"Failed to generate thumbnail for {video_id}: {e}")
+                return video_id, None
+        
+        max_workers = min(self.config.max_concurrent_requests, len(stories_batch))
+        
+        if max_workers <= 1:
+            outcomes = [generate_one(story_info) for story_info in stories_batch]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(generate_one, story_info) for story_info in stories_batch]
+                outcomes = [future.result() for future in as_completed(futures)]
+        
+        for video_id, thumbnail_path in outcomes:
+            if thumbnail_path:
+                results[video_id] = thumbnail_path
+                # Add to cost tracking
+                provider_used = self.config.primary_provider
+                total_cost += self.providers[provider_used]['cost_per_image']
         
         logger.info(f"Batch complete: {len(results)} thumbnails generated (${total_cost:.3f} total)")
         return results
     
     def get_provider_status(self) -> Dict[str, Any]:
-        """Get status of all thumbnail generation providers."""
+        """Get status of all thumbnail generation providers.
+        
+        Built from the API keys read at construction time; no provider
+        endpoints are contacted, so this is cheap to call on every command.
+        """
         status = {}
         
         for provider, config in self.providers.items():
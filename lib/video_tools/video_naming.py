@@ -21,6 +21,7 @@ class VideoNamingManager:
         
         # Story naming mapping
         self.story_mappings = {}
+        self.story_files = {}  # (story_id, language) -> story file path
         self._load_story_mappings()
     
     def _load_story_mappings(self):
@@ -29,6 +30,7 @@ class VideoNamingManager:
         
         # Scan all language directories for unique stories
         unique_stories = set()
+        story_paths = []
         
         for lang_dir in self.stories_path.iterdir():
             if lang_dir.is_dir() and lang_dir.name in ['en', 'es', 'fr', 'ur', 'ar']:
@@ -38,12 +40,21 @@ class VideoNamingManager:
                     if story_name.endswith(f"_{lang_dir.name}"):
                         base_name = story_name[:-3]  # Remove _en, _es, etc.
                         unique_stories.add(base_name)
+                        story_paths.append((base_name, lang_dir.name, story_file))
         
         # Create simple numeric mappings
         for story_name in sorted(unique_stories):
             story_id = f"story_{story_count:03d}"
             self.story_mappings[story_name] = story_id
             story_count += 1
+        
+        # Index story files by ID so lookups don't rescan directories
+        for base_name, language, story_file in story_paths:
+            self.story_files[(self.story_mappings[base_name], language)] = story_file
+    
+    def get_story_file(self, story_id: str, language: str) -> Optional[Path]:
+        """Get the story file for a story ID and language, if one was found."""
+        return self.story_files.get((story_id, language))
     
     def get_story_id_from_filename(self, filename: str) -> str:
         """Extract story ID from filename."""
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import pickle
+import time
 from typing import Dict, Optional, List
 from pathlib import Path
 
@@ -19,6 +20,11 @@ from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from dotenv import load_dotenv
 
+# Resumable upload chunk size (must be a multiple of 256 KB). A failed
+# request then re-sends one chunk rather than the whole video
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_RETRIES = 3
+
 class YouTubeUploader:
     """Handles YouTube video uploads with playlist management"""
     
@@ -141,7 +147,7 @@ class YouTubeUploader:
             # Prepare video file for upload
             media = MediaFileUpload(
                 video_path,
-                chunksize=-1,
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True,
                 mimetype='video/mp4'
             )
@@ -195,8 +201,8 @@ class YouTubeUploader:
         
         while response is None:
             try:
-                print(f"🔄 Upload attempt {retry + 1}")
                 status, response = upload_request.next_chunk()
+                retry = 0
                 
                 if status:
                     progress = int(status.progress() * 100)
@@ -206,9 +212,14 @@ class YouTubeUploader:
                 if e.resp.status in [500, 502, 503, 504]:
                     error = f"Server error: {e}"
                     retry += 1
-                    if retry > 3:
+                    if retry > MAX_UPLOAD_RETRIES:
                         print(f"❌ Max retries exceeded: {error}")
                         return None
+                    # The next call resumes from the last chunk the server
+                    # acknowledged, so back off and retry just that chunk
+                    wait_time = 2 ** retry
+                    print(f"🔄 {error} - retrying chunk in {wait_time}s (attempt {retry + 1})")
+                    time.sleep(wait_time)
                 else:
                     print(f"❌ HTTP Error: {e}")
                     return None
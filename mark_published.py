@@ -18,10 +18,12 @@ Usage:
 """
 
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent))
+from lib.jsonl_utils import load_json, save_json
+
 def mark_published(*video_ids):
     """Mark video(s) as published."""
     if not video_ids:
@@ -39,8 +41,7 @@ def mark_published(*video_ids):
         return
     
     # Load tracker data
-    with open(tracker_file, 'r', encoding='utf-8') as f:
-        tracker_data = json.load(f)
+    tracker_data = load_json(tracker_file)
     
     # Expand story IDs to all languages
     all_languages = ['en', 'es', 'fr', 'ur']
@@ -61,6 +62,8 @@ def mark_published(*video_ids):
     not_found = []
     already_published = []
     
+    now = datetime.now()
+    now_iso = now.isoformat()
     for video_id in expanded_ids:
         if video_id not in tracker_data:
             not_found.append(video_id)
@@ -77,19 +80,18 @@ def mark_published(*video_ids):
         
         # Update to published
         video['status'] = 'published'
-        video['updated_at'] = datetime.now().isoformat()
-        video['actual_publish_time'] = datetime.now().isoformat()
+        video['updated_at'] = now_iso
+        video['actual_publish_time'] = now_iso
         
         updated.append(video_id)
         print(f"\n✅ {video_id}: {current_status} → published")
         print(f"  Title: {video.get('title', 'N/A')}")
         print(f"  Language: {video.get('language', 'N/A').upper()}")
-        print(f"  Published: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"  Published: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Save updated tracker data
     if updated:
-        with open(tracker_file, 'w', encoding='utf-8') as f:
-            json.dump(tracker_data, f, indent=2, ensure_ascii=False)
+        save_json(tracker_data, tracker_file, pretty=False)
         print(f"\n💾 Saved changes to {tracker_file}")
     
     # Summary
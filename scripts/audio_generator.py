@@ -17,7 +17,7 @@ from typing import List, Dict, Optional
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from lib.tts_manager import create_default_tts_manager, TTSManager
-from lib.jsonl_utils import load_jsonl, save_jsonl
+from lib.jsonl_utils import iter_jsonl, load_jsonl, save_jsonl
 
 class AudioGenerator:
     """Orchestrates the conversion of stories to audio files for the weekly pipeline."""
@@ -230,13 +230,8 @@ class AudioGenerator:
     def get_audio_summary(self) -> Dict:
         """Get summary of all audio files for the current batch."""
         
-        try:
-            stories = load_jsonl(self.stories_file)
-        except Exception as e:
-            return {"error": f"Cannot load stories: {e}"}
-        
         summary = {
-            "total_stories": len(stories),
+            "total_stories": 0,
             "with_audio": 0,
             "without_audio": 0,
             "failed_audio": 0,
@@ -245,30 +240,34 @@ class AudioGenerator:
             "audio_files": []
         }
         
-        for story in stories:
-            audio_metadata = story.get('audio', {})
-            
-            if not audio_metadata:
-                summary['without_audio'] += 1
-                continue
-            
-            if audio_metadata.get('status') == 'failed':
-                summary['failed_audio'] += 1
-                continue
-            
-            if audio_metadata.get('status') == 'completed':
-                summary['with_audio'] += 1
-                summary['total_duration'] += audio_metadata.get('duration_seconds', 0)
-                summary['total_cost'] += audio_metadata.get('generation_cost', 0)
+        try:
+            for story in iter_jsonl(self.stories_file):
+                summary['total_stories'] += 1
+                audio_metadata = story.get('audio', {})
                 
-                summary['audio_files'].append({
-                    "story_id": story.get('id'),
-                    "title": story.get('title', 'Untitled'),
-                    "duration": audio_metadata.get('duration_seconds', 0),
-                    "provider": audio_metadata.get('provider'),
-                    "file_path": audio_metadata.get('file_path')
-                })
-        
+                if not audio_metadata:
+                    summary['without_audio'] += 1
+                    continue
+                
+                if audio_metadata.get('status') == 'failed':
+                    summary['failed_audio'] += 1
+                    continue
+                
+                if audio_metadata.get('status') == 'completed':
+                    summary['with_audio'] += 1
+                    summary['total_duration'] += audio_metadata.get('duration_seconds', 0)
+                    summary['total_cost'] += audio_metadata.get('generation_cost', 0)
+                    
+                    summary['audio_files'].append({
+                        "story_id": story.get('id'),
+                        "title": story.get('title', 'Untitled'),
+                        "duration": audio_metadata.get('duration_seconds', 0),
+                        "provider": audio_metadata.get('provider'),
+                        "file_path": audio_metadata.get('file_path')
+                    })
+        except Exception as e:
+            return {"error": f"Cannot load stories: {e}"}
+            
         return summary
 
 def main():
@@ -94,14 +94,20 @@ class LearningExtractor:
         
         return learning
     
-    def process_verses(self, limit: Optional[int] = None) -> List[Learning]:
-        """Process verses and extract unique learnings."""
+    def process_verses(self, limit: Optional[int] = None, start_offset: int = 0) -> List[Learning]:
+        """Process verses and extract unique learnings.
+        
+        Args:
+            limit: Maximum number of verses to process
+            start_offset: Byte offset of the first line to read (must be a line start)
+        """
         learnings = []
         processed_count = 0
         
         print(f"🔄 Processing verses from {self.data_file}")
         
         with open(self.data_file, 'r', encoding='utf-8') as f:
+            f.seek(start_offset)
             for line_num, line in enumerate(f, 1):
                 if not line.strip():
                     continue
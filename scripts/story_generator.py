@@ -16,7 +16,7 @@ import hashlib
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from lib.llm_tools import LLMManager, create_default_manager, LLMResponse
+from lib.llm_tools import LLMManager, get_default_manager, LLMResponse
 
 @dataclass
 class Story:
@@ -50,7 +50,7 @@ class StoryGenerator:
                  llm_manager: Optional[LLMManager] = None):
         self.learnings_file = learnings_file
         self.output_dir = output_dir
-        self.llm_manager = llm_manager or create_default_manager()
+        self.llm_manager = llm_manager or get_default_manager()
         
         # Load prompt templates
         self.prompts = self._load_prompts()
@@ -10,12 +10,13 @@ import json
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from lib.tts_manager import create_default_tts_manager
-from lib.jsonl_utils import load_jsonl
+from lib.tts_manager import TTSManager, create_default_tts_manager
+from lib.jsonl_utils import iter_jsonl
 
 class TTSSystemTester:
     """Comprehensive testing for the TTS system."""
@@ -29,6 +30,9 @@ class TTSSystemTester:
             "errors": []
         }
         
+        # Set by test_manager_initialization; later tests bail out while None
+        self.manager: Optional[TTSManager] = None
+        
         # Create test data directory
         self.test_dir = Path("test_audio_output")
         self.test_dir.mkdir(exist_ok=True)
@@ -87,7 +91,7 @@ class TTSSystemTester:
         """Test individual provider functionality."""
         print("\n🏭 Test 2: Provider Availability")
         
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.record_test_fail("Manager not available for provider testing")
             return
         
@@ -113,7 +117,7 @@ class TTSSystemTester:
         """Test voice selection for different audiences."""
         print("\n🎤 Test 3: Voice Selection System")
         
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.record_test_fail("Manager not available for voice testing")
             return
         
@@ -133,7 +137,7 @@ class TTSSystemTester:
         """Test cost estimation across providers."""
         print("\n💰 Test 4: Cost Estimation")
         
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.record_test_fail("Manager not available for cost testing")
             return
         
@@ -160,7 +164,7 @@ class TTSSystemTester:
         """Test audio generation with sample story."""
         print("\n🎵 Test 5: Sample Audio Generation")
         
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.record_test_fail("Manager not available for audio testing")
             return
         
@@ -204,19 +208,18 @@ class TTSSystemTester:
             return
         
         try:
-            stories = load_jsonl(stories_file)
+            # Test with first story (no need to parse the rest of the file)
+            test_story = next(iter_jsonl(stories_file), None)
             
-            if not stories:
+            if test_story is None:
                 print(f"   ⏭️ No stories found in {stories_file}")
                 return
             
-            # Test with first story
-            test_story = stories[0]
             story_id = test_story.get('id', 'unknown')
             
             print(f"   📖 Testing with story: {story_id}")
             
-            if not hasattr(self, 'manager'):
+            if self.manager is None:
                 self.record_test_fail("Manager not available for story processing")
                 return
             
@@ -246,7 +249,7 @@ class TTSSystemTester:
         """Test provider comparison functionality."""
         print("\n📊 Test 7: Provider Comparison")
         
-        if not hasattr(self, 'manager'):
+        if self.manager is None:
             self.record_test_fail("Manager not available for comparison testing")
             return
         
@@ -284,36 +287,39 @@ class TTSSystemTester:
     
     def print_test_results(self):
         """Print comprehensive test results."""
-        print("\n" + "=" * 50)
-        print("🧪 TTS System Test Results")
-        print("=" * 50)
-        
         results = self.test_results
         
-        print(f"📊 Tests Run: {results['tests_run']}")
-        print(f"✅ Passed: {results['tests_passed']}")
-        print(f"❌ Failed: {results['tests_failed']}")
+        lines = [
+            "",
+            "=" * 50,
+            "🧪 TTS System Test Results",
+            "=" * 50,
+            f"📊 Tests Run: {results['tests_run']}",
+            f"✅ Passed: {results['tests_passed']}",
+            f"❌ Failed: {results['tests_failed']}",
+        ]
         
         if results['tests_run'] > 0:
             success_rate = (results['tests_passed'] / results['tests_run']) * 100
-            print(f"📈 Success Rate: {success_rate:.1f}%")
+            lines.append(f"📈 Success Rate: {success_rate:.1f}%")
         
         if results['errors']:
-            print(f"\n⚠️ Errors Encountered:")
-            for i, error in enumerate(results['errors'], 1):
-                print(f"   {i}. {error}")
+            lines.append("\n⚠️ Errors Encountered:")
+            lines.extend(f"   {i}. {error}" for i, error in enumerate(results['errors'], 1))
         
         # System recommendations
-        print(f"\n💡 System Status:")
+        lines.append("\n💡 System Status:")
         if results['tests_failed'] == 0:
-            print("   🟢 TTS system is fully operational!")
-            print("   ✨ Ready for production audio generation")
+            lines.append("   🟢 TTS system is fully operational!")
+            lines.append("   ✨ Ready for production audio generation")
         elif results['tests_failed'] < results['tests_passed']:
-            print("   🟡 TTS system is partially operational")
-            print("   🔧 Some features may need configuration")
+            lines.append("   🟡 TTS system is partially operational")
+            lines.append("   🔧 Some features may need configuration")
         else:
-            print("   🔴 TTS system needs attention")
-            print("   🛠️ Check API keys and provider configurations")
+            lines.append("   🔴 TTS system needs attention")
+            lines.append("   🛠️ Check API keys and provider configurations")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save results to file
         results_file = self.test_dir / f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
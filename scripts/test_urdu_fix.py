@@ -39,8 +39,10 @@ def test_urdu_fix():
         print(f"\n✨ Clean script length: {len(clean_script)} characters")
         print(f"📖 First 200 chars of clean script:\n'{clean_script[:200]}...'")
         
-        # Test quality metrics
-        quality_metrics = translator.validate_script_quality(clean_script, 'ur')
+        # Test quality metrics (computed by translate_story when available)
+        quality_metrics = result.get('translation_metadata', {}).get('quality_metrics')
+        if quality_metrics is None:
+            quality_metrics = translator.validate_script_quality(clean_script, 'ur')
         print(f"\n📊 Quality metrics:")
         print(f"   - Word count: {quality_metrics['word_count']}")
         print(f"   - Whiteboard ready: {'✅' if quality_metrics['whiteboard_ready'] else '❌'}")
@@ -7,12 +7,41 @@ Adds thumbnail generation capabilities to the video production workflow.
 import sys
 from pathlib import Path
 
+# Project locations, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_LIB_DIR = _PROJECT_ROOT / "lib"
+_STORIES_DIR = _PROJECT_ROOT / "data" / "stories"
+_CONFIG_FILE = _PROJECT_ROOT / "config" / "thumbnail_config.json"
+
 # Add the lib directory to the path
-sys.path.append(str(Path(__file__).parent.parent / "lib"))
+if str(_LIB_DIR) not in sys.path:
+    sys.path.append(str(_LIB_DIR))
 
-from video_tools.thumbnail_generator import ThumbnailGenerator, ThumbnailConfig
+from video_tools.thumbnail_generator import ThumbnailGenerator, ThumbnailConfig, PROVIDER_API_KEY_ENV
 from video_tools.video_naming import VideoNamingManager
-import json
+from story_utils import load_story_cached, iter_json_files
+from jsonl_utils import load_json, save_json
+
+# Instances reused across command dispatch within one process
+_generator_cache = {}
+_naming_manager = None
+
+def get_generator(config: ThumbnailConfig = None) -> ThumbnailGenerator:
+    """Get a shared ThumbnailGenerator for the given configuration."""
+    config = config or ThumbnailConfig()
+    # Keyed on every field (the dataclass repr), since the config isn't
+    # hashable and any field can change how the generator behaves
+    key = repr(config)
+    if key not in _generator_cache:
+        _generator_cache[key] = ThumbnailGenerator(config)
+    return _generator_cache[key]
+
+def get_naming_manager() -> VideoNamingManager:
+    """Get the shared VideoNamingManager, scanning stories on first use."""
+    global _naming_manager
+    if _naming_manager is None:
+        _naming_manager = VideoNamingManager()
+    return _naming_manager
 
 def add_thumbnail_commands(parser):
     """Add thumbnail-related commands to the argument parser."""
@@ -51,37 +80,37 @@ def handle_thumbnail_commands(args):
     """Handle thumbnail-related commands."""
     
     if args.thumbnail_action == 'status':
-        print("🎨 THUMBNAIL PROVIDER STATUS")
-        print("=" * 60)
+        lines = [
+            "🎨 THUMBNAIL PROVIDER STATUS",
+            "=" * 60
+        ]
         
-        generator = ThumbnailGenerator()
+        generator = get_generator()
         provider_status = generator.get_provider_status()
         
         for provider, status in provider_status.items():
             available = "✅" if status['available'] else "❌"
             recommended = "⭐" if status['recommended'] else "  "
             cost = f"${status['cost_per_image']:.3f}/image"
-            print(f"{recommended} {available} {provider.upper()}: {cost} - {status['best_for']}")
+            lines.append(f"{recommended} {available} {provider.upper()}: {cost} - {status['best_for']}")
         
-        print(f"\n💰 Cost per 5-video batch:")
-        print(f"   OpenAI only: $0.20")
-        print(f"   Stability only: $0.10") 
-        print(f"   Mixed strategy: $0.15")
+        lines.append("\n💰 Cost per 5-video batch:")
+        lines.append("   OpenAI only: $0.20")
+        lines.append("   Stability only: $0.10")
+        lines.append("   Mixed strategy: $0.15")
         
         # Check for missing API keys
-        missing_keys = []
-        if not status.get('available'):
-            if provider == 'openai' and not generator.openai_api_key:
-                missing_keys.append('OPENAI_API_KEY')
-            elif provider == 'stability' and not generator.stability_api_key:
-                missing_keys.append('STABILITY_API_KEY')
-            elif provider == 'gemini' and not generator.gemini_api_key:
-                missing_keys.append('GEMINI_API_KEY')
+        missing_keys = [
+            PROVIDER_API_KEY_ENV[provider]
+            for provider, status in provider_status.items()
+            if not status['available']
+        ]
         
         if missing_keys:
-            print(f"\n⚠️  Missing API keys: {', '.join(missing_keys)}")
-            print("   Add them to your .env file to enable those providers")
+            lines.append(f"\n⚠️  Missing API keys: {', '.join(missing_keys)}")
+            lines.append("   Add them to your .env file to enable those providers")
         
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     elif args.thumbnail_action == 'generate':
@@ -98,14 +127,16 @@ def handle_thumbnail_commands(args):
         language = parts[-1]             # en
         
         # Find story file
-        naming_manager = VideoNamingManager()
-        stories_path = Path(__file__).parent.parent / "data" / "stories" / language
+        naming_manager = get_naming_manager()
+        stories_path = _STORIES_DIR / language
         
-        story_file = None
-        for file in stories_path.glob("*.json"):
-            if naming_manager.get_story_id_from_filename(str(file)) == story_id:
-                story_file = file
-                break
+        story_file = naming_manager.get_story_file(story_id, language)
+        if not story_file and stories_path.is_dir():
+            # Fall back to a scan for files outside the naming index
+            for entry in iter_json_files(stories_path):
+                if naming_manager.get_story_id_from_filename(entry.name) == story_id:
+                    story_file = Path(entry.path)
+                    break
         
         if not story_file:
             print(f"❌ Story file not found for {args.video_id}")
@@ -113,8 +144,7 @@ def handle_thumbnail_commands(args):
         
         # Load story data
         try:
-            with open(story_file, 'r', encoding='utf-8') as f:
-                story_data = json.load(f)
+            story_data = load_story_cached(story_file)
         except Exception as e:
             print(f"❌ Failed to load story data: {e}")
             return
@@ -126,7 +156,7 @@ def handle_thumbnail_commands(args):
             include_title_overlay=not args.no_text
         )
         
-        generator = ThumbnailGenerator(config)
+        generator = get_generator(config)
         
         # Generate thumbnail
         print(f"🔄 Generating {args.style} thumbnail using {args.provider}...")
@@ -168,18 +198,16 @@ def handle_thumbnail_commands(args):
             include_title_overlay=True
         )
         
-        generator = ThumbnailGenerator(config)
-        naming_manager = VideoNamingManager()
+        generator = get_generator(config)
+        naming_manager = get_naming_manager()
         
         # Prepare batch data
         stories_batch = []
-        total_cost = 0
         
         for video_meta in batch:
             # Load story data
             try:
-                with open(video_meta.script_path, 'r', encoding='utf-8') as f:
-                    story_data = json.load(f)
+                story_data = load_story_cached(video_meta.script_path)
                 
                 video_id = f"{naming_manager.get_story_id_from_filename(video_meta.script_path)}_{video_meta.language}"
                 
@@ -189,13 +217,11 @@ def handle_thumbnail_commands(args):
                     'video_id': video_id
                 })
                 
-                cost = generator.providers[args.provider]['cost_per_image']
-                total_cost += cost
-                
             except Exception as e:
                 print(f"❌ Failed to load {video_meta.script_path}: {e}")
         
-        print(f"💰 Estimated total cost: ${total_cost:.3f}")
+        cost_per_image = generator.providers[args.provider]['cost_per_image']
+        print(f"💰 Estimated total cost: ${len(stories_batch) * cost_per_image:.3f}")
         
         # Generate batch
         results = generator.generate_batch_thumbnails(stories_batch)
@@ -203,6 +229,7 @@ def handle_thumbnail_commands(args):
         print(f"\n✅ Generated {len(results)} thumbnails:")
         for video_id, thumbnail_path in results.items():
             print(f"   {video_id}: {thumbnail_path}")
+        print(f"💰 Actual cost: ${len(results) * cost_per_image:.3f}")
         
         if len(results) < len(stories_batch):
             failed = len(stories_batch) - len(results)
@@ -213,13 +240,12 @@ def handle_thumbnail_commands(args):
         print("=" * 60)
         
         # Load current config or create new
-        config_file = Path(__file__).parent.parent / "config" / "thumbnail_config.json"
+        config_file = _CONFIG_FILE
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_file, 'r') as f:
-                current_config = json.load(f)
-        except:
+            current_config = load_json(config_file)
+        except (OSError, ValueError):
             current_config = {}
         
         # Update config based on arguments
@@ -233,8 +259,7 @@ def handle_thumbnail_commands(args):
             current_config['include_title_overlay'] = False
         
         # Save updated config
-        with open(config_file, 'w') as f:
-            json.dump(current_config, f, indent=2)
+        save_json(current_config, config_file)
         
         print("✅ Configuration updated:")
         for key, value in current_config.items():
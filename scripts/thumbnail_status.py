@@ -47,19 +47,19 @@ def main():
     # Check for missing API keys and provide setup guidance
     print(f"\n🔧 Setup Status:")
     
-    if generator.openai_api_key:
+    if provider_status['openai']['available']:
         print("   ✅ OpenAI API key configured")
     else:
         print("   ❌ OpenAI API key missing")
         print("      Add OPENAI_API_KEY to your .env file")
     
-    if generator.stability_api_key:
+    if provider_status['stability']['available']:
         print("   ✅ Stability AI API key configured") 
     else:
         print("   ⚠️  Stability AI API key missing (optional but recommended)")
         print("      Add STABILITY_API_KEY to your .env file")
     
-    if generator.gemini_api_key:
+    if provider_status['gemini']['available']:
         print("   ✅ Gemini API key configured")
     else:
         print("   ℹ️  Gemini API key missing (optional)")
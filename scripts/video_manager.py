@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add project root to path
@@ -17,7 +18,7 @@ sys.path.insert(0, str(project_root))
 
 from lib.video_tools.video_tracker import VideoTracker, VideoStatus
 from lib.video_tools.batch_manager import ProductionBatchManager
-from lib.translators.natural_translator import NaturalTranslator
+from lib.story_utils import load_story_cached, iter_json_files
 
 class VideoManagementCLI:
     """Command-line interface for video production management."""
@@ -26,7 +27,15 @@ class VideoManagementCLI:
         """Initialize CLI with managers."""
         self.tracker = VideoTracker()
         self.batch_manager = ProductionBatchManager()
-        self.translator = NaturalTranslator()
+        self._translator = None
+    
+    @property
+    def translator(self):
+        """NaturalTranslator, imported and created on first use."""
+        if self._translator is None:
+            from lib.translators.natural_translator import NaturalTranslator
+            self._translator = NaturalTranslator()
+        return self._translator
     
     def register_translated_stories(self, stories_dir: str = "data/stories"):
         """
@@ -42,45 +51,58 @@ class VideoManagementCLI:
         
         registered_count = 0
         
-        # Process each language directory
+        # Collect story files for each language directory
+        language_entries = []
         for lang_dir in stories_path.iterdir():
             if not lang_dir.is_dir() or lang_dir.name.startswith('.'):
                 continue
+            language_entries.append((lang_dir.name, list(iter_json_files(lang_dir))))
+        
+        # Story files are small and IO-bound, so load them in parallel;
+        # tracker updates stay on this thread
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            language_loads = [
+                (language, [
+                    (story_entry, executor.submit(load_story_cached, story_entry.path, story_entry.stat()))
+                    for story_entry in story_entries
+                ])
+                for language, story_entries in language_entries
+            ]
             
-            language = lang_dir.name
-            print(f"\n📁 Processing {language.upper()} stories...")
-            
-            # Process each story file
-            for story_file in lang_dir.glob("*.json"):
-                try:
-                    with open(story_file, 'r', encoding='utf-8') as f:
-                        story_data = json.load(f)
-                    
-                    # Extract story information
-                    story_id = story_file.stem.replace(f"_{language}", "")
-                    title = story_data.get('title', story_file.stem)
-                    duration = story_data.get('estimated_duration')
-                    
-                    # Check if already registered
-                    video_id = f"{story_id}_{language}"
-                    if video_id in self.tracker.videos:
-                        print(f"   ⚠️  Already registered: {title}")
-                        continue
-                    
-                    # Register with tracker
-                    registered_id = self.tracker.register_script(
-                        story_id=story_id,
-                        language=language,
-                        script_path=str(story_file),
-                        title=title,
-                        duration_seconds=duration
-                    )
-                    
-                    print(f"   ✅ Registered: {title} ({registered_id})")
-                    registered_count += 1
-                    
-                except Exception as e:
-                    print(f"   ❌ Failed to register {story_file.name}: {e}")
+            for language, story_loads in language_loads:
+                print(f"\n📁 Processing {language.upper()} stories...")
+                
+                # Process each story file
+                for story_entry, story_load in story_loads:
+                    story_stem = story_entry.name[:-len('.json')]
+                    try:
+                        story_data = story_load.result()
+                        
+                        # Extract story information
+                        story_id = story_stem.replace(f"_{language}", "")
+                        title = story_data.get('title', story_stem)
+                        duration = story_data.get('estimated_duration')
+                        
+                        # Check if already registered
+                        video_id = f"{story_id}_{language}"
+                        if video_id in self.tracker.videos:
+                            print(f"   ⚠️  Already registered: {title}")
+                            continue
+                        
+                        # Register with tracker
+                        registered_id = self.tracker.register_script(
+                            story_id=story_id,
+                            language=language,
+                            script_path=story_entry.path,
+                            title=title,
+                            duration_seconds=duration
+                        )
+                        
+                        print(f"   ✅ Registered: {title} ({registered_id})")
+                        registered_count += 1
+                        
+                    except Exception as e:
+                        print(f"   ❌ Failed to register {story_entry.name}: {e}")
         
         print(f"\n🎉 Registered {registered_count} new scripts for production!")
         return registered_count > 0
@@ -89,43 +111,47 @@ class VideoManagementCLI:
         """Display current production status."""
         dashboard = self.batch_manager.get_production_dashboard()
         
-        print("🎬 Video Production Dashboard")
-        print("=" * 50)
+        lines = [
+            "🎬 Video Production Dashboard",
+            "=" * 50
+        ]
         
         # Overview
         overview = dashboard['overview']
-        print(f"📊 OVERVIEW")
-        print(f"   Total Videos: {overview['total_videos']}")
-        print(f"   Ready for Production: {dashboard['next_production_batch']['total_videos']}")
-        print(f"   Ready to Publish: {overview['ready_to_publish']}")
-        print(f"   Scheduled (Next 7 Days): {dashboard['publishing_schedule']['total_scheduled']}")
+        lines.append("📊 OVERVIEW")
+        lines.append(f"   Total Videos: {overview['total_videos']}")
+        lines.append(f"   Ready for Production: {dashboard['next_production_batch']['total_videos']}")
+        lines.append(f"   Ready to Publish: {overview['ready_to_publish']}")
+        lines.append(f"   Scheduled (Next 7 Days): {dashboard['publishing_schedule']['total_scheduled']}")
         
         # Status breakdown
-        print(f"\n📈 STATUS BREAKDOWN")
+        lines.append("\n📈 STATUS BREAKDOWN")
         for status, count in overview['by_status'].items():
             if count > 0:
                 status_display = status.replace('_', ' ').title()
-                print(f"   {status_display}: {count}")
+                lines.append(f"   {status_display}: {count}")
         
         # Language distribution
-        print(f"\n🌍 BY LANGUAGE")
+        lines.append("\n🌍 BY LANGUAGE")
         for language, count in overview['by_language'].items():
             if count > 0:
-                print(f"   {language.upper()}: {count}")
+                lines.append(f"   {language.upper()}: {count}")
         
         # Next production batch
         next_batch = dashboard['next_production_batch']
         if next_batch['total_videos'] > 0:
-            print(f"\n🎯 NEXT PRODUCTION BATCH ({next_batch['total_videos']} videos)")
+            lines.append(f"\n🎯 NEXT PRODUCTION BATCH ({next_batch['total_videos']} videos)")
             for lang, count in next_batch['by_language'].items():
-                print(f"   {lang.upper()}: {count} videos")
+                lines.append(f"   {lang.upper()}: {count} videos")
         
         # Publishing schedule
         schedule = dashboard['publishing_schedule']['by_date']
         if schedule:
-            print(f"\n📅 PUBLISHING SCHEDULE")
+            lines.append("\n📅 PUBLISHING SCHEDULE")
             for date, count in list(schedule.items())[:7]:  # Next 7 days
-                print(f"   {date}: {count} videos")
+                lines.append(f"   {date}: {count} videos")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_next_batch(self):
         """Show next production batch details."""
@@ -136,15 +162,20 @@ class VideoManagementCLI:
             return
         
         total_videos = sum(len(videos) for videos in next_batch.values())
-        print(f"🎬 Next Production Batch - {total_videos} Videos")
-        print("=" * 50)
+        lines = [
+            f"🎬 Next Production Batch - {total_videos} Videos",
+            "=" * 50
+        ]
         
         for lang, videos in next_batch.items():
-            print(f"\n🗣️  {lang.upper()} - {len(videos)} videos:")
+            lines.append(f"\n🗣️  {lang.upper()} - {len(videos)} videos:")
             for video in videos:
                 duration = f"{video.duration_seconds}s" if video.duration_seconds else "Unknown"
                 created = datetime.fromisoformat(video.created_at).strftime("%m/%d")
-                print(f"   • {video.title} ({duration}) - Created: {created}")
+                lines.append(f"   • {video.title} ({duration}) - Created: {created}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         # Ask if user wants to mark as in production
         response = input(f"\n📤 Mark these {total_videos} videos as 'In Production'? (y/n): ")
@@ -4,46 +4,121 @@ Weekly Cadence Manager for Guidora Automation
 Processes content in manageable weekly chunks
 """
 
-import json
+import logging
 import os
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List
 from learning_extractor import LearningExtractor
 from story_generator import StoryGenerator
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.jsonl_utils import _write_atomic, append_jsonl, iter_jsonl, load_json, save_json
+
+logger = logging.getLogger("weekly_cadence")
+
 class WeeklyCadenceManager:
     """Manages weekly processing of content generation."""
     
     def __init__(self):
         self.state_file = "data/weekly_state.json"
+        self.weeks_log_file = "data/weeks_completed.jsonl"
+        self.verses_file = "data/tafsir/quran_filtered.jsonl"
         self.verses_per_week = 200  # Configurable batch size
+        self.story_concurrency = int(os.getenv("STORY_CONCURRENCY", "8"))
+        self.story_requests_per_second = float(os.getenv("STORY_REQUESTS_PER_SECOND", "2"))
+        self._next_request_at = 0.0
+        self._request_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._extractor = None
+        self._story_generator = None
         self.load_state()
     
+    @property
+    def extractor(self) -> LearningExtractor:
+        """LearningExtractor, created on first use and reused across runs."""
+        if self._extractor is None:
+            self._extractor = LearningExtractor(
+                data_file=self.verses_file,
+                output_file="data/learnings/learnings.jsonl"
+            )
+        return self._extractor
+    
+    @property
+    def story_generator(self) -> StoryGenerator:
+        """StoryGenerator shared by all worker threads, created on first use."""
+        if self._story_generator is None:
+            self._story_generator = StoryGenerator()
+        return self._story_generator
+    
     def load_state(self):
         """Load current processing state."""
         if os.path.exists(self.state_file):
-            with open(self.state_file, 'r') as f:
-                self.state = json.load(f)
+            self.state = load_json(self.state_file)
                 
             # Migrate old state format to include story generation
             if "total_stories_generated" not in self.state:
                 self.state["total_stories_generated"] = 0
-                print("🔄 Migrating state to include story generation tracking")
+                logger.info("🔄 Migrating state to include story generation tracking")
         else:
             self.state = {
                 "current_week": 1,
                 "last_processed_verse": 0,
                 "total_learnings_generated": 0,
                 "total_stories_generated": 0,
-                "last_run_date": None,
-                "weeks_completed": []
+                "last_run_date": None
             }
     
+    @property
+    def weeks_completed(self) -> List[Dict]:
+        """Completed week entries, read from the append-only log on demand.
+        
+        Entries still held in an old-format state file (not yet migrated)
+        are included too.
+        """
+        logged = self._logged_weeks()
+        logged_keys = {self._week_key(entry) for entry in logged}
+        return logged + [
+            entry for entry in self.state.get("weeks_completed", [])
+            if self._week_key(entry) not in logged_keys
+        ]
+    
+    def _logged_weeks(self) -> List[Dict]:
+        """Entries in the append-only week log (empty if there is none yet)."""
+        if not os.path.exists(self.weeks_log_file):
+            return []
+        return list(iter_jsonl(self.weeks_log_file))
+    
+    @staticmethod
+    def _week_key(entry: Dict):
+        """Identity of a week entry, used to avoid logging it twice."""
+        return entry.get("week"), entry.get("date")
+    
+    def _migrate_weeks_log(self):
+        """Move week history out of an old-format state file into the log.
+        
+        Only called on the write path, so merely loading state never
+        rewrites files. Entries already in the log (e.g. from a migration
+        interrupted before the state was saved) are not appended twice.
+        """
+        if "weeks_completed" not in self.state:
+            return
+        
+        logged_keys = {self._week_key(entry) for entry in self._logged_weeks()}
+        for week_entry in self.state.pop("weeks_completed"):
+            if self._week_key(week_entry) not in logged_keys:
+                append_jsonl(week_entry, self.weeks_log_file)
+                logged_keys.add(self._week_key(week_entry))
+        logger.info("🔄 Migrating completed weeks to append-only log")
+    
     def save_state(self):
-        """Save current processing state."""
+        """Save current processing state (counters only, not week history)."""
         os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        save_json(self.state, self.state_file)
     
     def should_run_this_week(self) -> bool:
         """Check if we should run processing this week."""
@@ -58,78 +133,154 @@ class WeeklyCadenceManager:
     def run_weekly_processing(self):
         """Run this week's processing batch."""
         if not self.should_run_this_week():
-            print("⏰ Weekly processing already completed this week")
+            logger.info("⏰ Weekly processing already completed this week")
             return
         
-        print(f"🚀 Starting Week {self.state['current_week']} Processing")
-        print(f"📊 Processing verses {self.state['last_processed_verse'] + 1} to {self.state['last_processed_verse'] + self.verses_per_week}")
+        self._migrate_weeks_log()
         
-        # Step 1: Learning Extraction
-        print(f"\n📚 Step 1: Learning Extraction")
-        extractor = LearningExtractor(
-            data_file="data/tafsir/quran_filtered.jsonl",
-            output_file="data/learnings/learnings.jsonl"
-        )
+        logger.info(f"🚀 Starting Week {self.state['current_week']} Processing")
+        logger.info(f"📊 Processing verses {self.state['last_processed_verse'] + 1} to {self.state['last_processed_verse'] + self.verses_per_week}")
         
-        learnings = self._process_batch(extractor)
-        print(f"✅ Extracted {len(learnings)} new learnings")
+        # Step 1: Learning Extraction
+        logger.info(f"\n📚 Step 1: Learning Extraction")
+        learnings = self._process_batch(self.extractor)
+        logger.info(f"✅ Extracted {len(learnings)} new learnings")
         
         # Step 2: Story Generation (only if we have new learnings)
         stories_generated = 0
-        if learnings:
-            print(f"\n🎬 Step 2: Story Generation")
+        if learnings and not self._has_llm_api_key():
+            # Check once up front instead of failing every per-learning call
+            logger.warning(f"\n🎬 Step 2: Story Generation - Skipped (no LLM API key configured)")
+            logger.warning(f"   💡 Set OPENAI_API_KEY or ANTHROPIC_API_KEY to enable story generation")
+        elif learnings:
+            logger.info(f"\n🎬 Step 2: Story Generation")
             try:
-                story_generator = StoryGenerator()
+                story_generator = self.story_generator
                 
-                # Generate stories for each new learning
-                for learning_data in learnings:
-                    try:
-                        # Generate universal story
-                        story = story_generator.generate_story(learning_data.__dict__ if hasattr(learning_data, '__dict__') else learning_data, target_audience='universal')
-                        story_generator.save_story(story)
-                        stories_generated += 1
-                        print(f"   ✅ Generated story: {story.title[:50]}...")
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Failed to generate story for learning: {e}")
+                # Generate stories for each new learning; LLM calls are
+                # independent and network-bound, so run them concurrently
+                with ThreadPoolExecutor(max_workers=max(1, self.story_concurrency)) as executor:
+                    futures = [
+                        executor.submit(self._generate_story, story_generator, learning_data)
+                        for learning_data in learnings
+                    ]
+                    
+                    for future in as_completed(futures):
+                        try:
+                            story = future.result()
+                            stories_generated += 1
+                            logger.debug("   ✅ Generated story: %s...", story.title[:50])
+                            
+                        except Exception as e:
+                            logger.warning(f"   ⚠️ Failed to generate story for learning: {e}")
                         
             except Exception as e:
-                print(f"   ⚠️ Story generation not available (likely missing API key): {e}")
-                print(f"   💡 Set OPENAI_API_KEY or ANTHROPIC_API_KEY to enable story generation")
+                logger.warning(f"   ⚠️ Story generation not available (likely missing API key): {e}")
+                logger.warning(f"   💡 Set OPENAI_API_KEY or ANTHROPIC_API_KEY to enable story generation")
         else:
-            print(f"\n🎬 Step 2: Story Generation - Skipped (no new learnings)")
+            logger.info(f"\n🎬 Step 2: Story Generation - Skipped (no new learnings)")
         
         # Update state
         self.state["last_processed_verse"] += self.verses_per_week
         self.state["total_learnings_generated"] += len(learnings)
         self.state["total_stories_generated"] += stories_generated
         self.state["last_run_date"] = datetime.now().isoformat()
-        self.state["weeks_completed"].append({
+        append_jsonl({
             "week": self.state["current_week"],
             "learnings_extracted": len(learnings),
             "stories_generated": stories_generated,
-            "date": datetime.now().isoformat()
-        })
+            "date": self.state["last_run_date"]
+        }, self.weeks_log_file)
         self.state["current_week"] += 1
         
         self.save_state()
         
-        print(f"\n✅ Week {self.state['current_week'] - 1} completed!")
-        print(f"📈 Total learnings generated: {self.state['total_learnings_generated']}")
-        print(f"🎬 Total stories generated: {self.state['total_stories_generated']}")
-        print(f"📊 Pipeline: Verses → Learnings → Stories → Ready for TTS (Week 3)")
+        logger.info(f"\n✅ Week {self.state['current_week'] - 1} completed!")
+        logger.info(f"📈 Total learnings generated: {self.state['total_learnings_generated']}")
+        logger.info(f"🎬 Total stories generated: {self.state['total_stories_generated']}")
+        logger.info(f"📊 Pipeline: Verses → Learnings → Stories → Ready for TTS (Week 3)")
+    
+    @staticmethod
+    def _has_llm_api_key() -> bool:
+        """Return True if any story generation provider has an API key set."""
+        return any(os.getenv(name) for name in (
+            "OPENAI_API_KEY", "OPENAI_API_KEYS", "ANTHROPIC_API_KEY", "ANTHROPIC_API_KEYS"
+        ))
+    
+    def _generate_story(self, story_generator: StoryGenerator, learning_data):
+        """Generate and save a universal story for one learning (thread-safe)."""
+        self._wait_for_request_slot()
+        story = story_generator.generate_story(learning_data.__dict__ if hasattr(learning_data, '__dict__') else learning_data, target_audience='universal')
+        
+        # save_story appends to shared JSONL files
+        with self._save_lock:
+            story_generator.save_story(story)
+        
+        return story
+    
+    def _wait_for_request_slot(self):
+        """Space out story generation requests to respect provider rate limits."""
+        if self.story_requests_per_second <= 0:
+            return
+        
+        min_interval = 1 / self.story_requests_per_second
+        with self._request_lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at)
+            self._next_request_at = request_at + min_interval
+        
+        if request_at > now:
+            time.sleep(request_at - now)
     
     def _process_batch(self, extractor: LearningExtractor) -> List:
-        """Process a batch of verses."""
-        # This is a simplified version - in real implementation,
-        # you'd skip to the correct starting position in the file
-        learnings = extractor.process_verses(limit=self.verses_per_week)
+        """Process a batch of verses, starting after the last processed one."""
+        start_offset = self._get_verse_offset(self.state["last_processed_verse"])
+        learnings = extractor.process_verses(limit=self.verses_per_week, start_offset=start_offset)
         
         if learnings:
             extractor.save_learnings(learnings)
         
         return learnings
     
+    def _get_verse_offset(self, verse_index: int) -> int:
+        """Return the byte offset of a line in the verses file.
+        
+        Offsets are cached in a sidecar file next to the data and rebuilt
+        whenever the verses file is newer than the cache or the cache
+        doesn't end at the verses file's size (short or stale). A cache hit
+        reads only the entries needed rather than the whole index.
+        """
+        offsets_file = self.verses_file + ".offsets"
+        
+        if (os.path.exists(offsets_file)
+                and os.path.getmtime(offsets_file) >= os.path.getmtime(self.verses_file)):
+            entry = array('q')
+            index_size = os.path.getsize(offsets_file)
+            entry_count = index_size // entry.itemsize
+            if entry_count > 0 and index_size % entry.itemsize == 0:
+                with open(offsets_file, 'rb') as f:
+                    # A complete index ends with the verses file's size
+                    f.seek((entry_count - 1) * entry.itemsize)
+                    entry.frombytes(f.read(entry.itemsize))
+                    if entry[0] == os.path.getsize(self.verses_file):
+                        # Past the last verse resumes at end of file
+                        f.seek(min(verse_index, entry_count - 1) * entry.itemsize)
+                        entry.frombytes(f.read(entry.itemsize))
+                        return entry[-1]
+        
+        offsets = array('q')
+        with open(self.verses_file, 'rb') as f:
+            position = 0
+            for line in f:
+                offsets.append(position)
+                position += len(line)
+            offsets.append(position)  # End of file
+        # Written atomically, so a partial file from an interrupted run
+        # never appears in place of the index
+        _write_atomic(offsets.tobytes(), offsets_file)
+        
+        return offsets[min(verse_index, len(offsets) - 1)]
+    
     def get_progress_report(self) -> Dict:
         """Get current progress statistics."""
         total_verses = 6236  # Your total verse count
@@ -147,12 +298,14 @@ class WeeklyCadenceManager:
             "learnings_generated": self.state["total_learnings_generated"],
             "stories_generated": self.state["total_stories_generated"],
             "estimated_weeks_remaining": estimated_weeks_remaining,
-            "weeks_completed": len(self.state["weeks_completed"])
+            "weeks_completed": len(self.weeks_completed)
         }
 
 
 def main():
     """Main function for weekly cadence management."""
+    logging.basicConfig(level=os.getenv("GUIDORA_LOG", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+    
     print("📅 Guidora Weekly Cadence Manager")
     print("=" * 40)
     
@@ -9,6 +9,13 @@ import sys
 import shutil
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from lib.file_utils import list_files
+from lib.jsonl_utils import load_json, save_json
+
+# Languages with production uploads
+LANGUAGES = ('en', 'es', 'fr', 'ur')
+
 def setup_final_upload_system():
     """Prepare final upload system with correct file paths"""
     
@@ -25,11 +32,16 @@ def setup_final_upload_system():
     
     print("\n📋 CHECKING PRODUCTION ASSETS:")
     
+    # Expected asset locations, resolved once per language
+    video_dirs = {lang: f"data/videos/production/{lang}" for lang in LANGUAGES}
+    video_names = {lang: f"seeing_signs_a_journey_to_inner_strength_{lang}.mp4" for lang in LANGUAGES}
+    thumb_dirs = {lang: f"assets/thumbnails/{lang}" for lang in LANGUAGES}
+    
     # Video files
     video_files = {}
-    for lang in ['en', 'es', 'fr', 'ur']:
-        video_path = f"data/videos/production/{lang}/seeing_signs_a_journey_to_inner_strength_{lang}.mp4"
-        if os.path.exists(video_path):
+    for lang in LANGUAGES:
+        video_path = f"{video_dirs[lang]}/{video_names[lang]}"
+        if video_names[lang] in list_files(video_dirs[lang]):
             video_files[lang] = video_path
             print(f"✅ Video {lang.upper()}: {video_path}")
         else:
@@ -37,9 +49,9 @@ def setup_final_upload_system():
     
     # Thumbnail files
     thumbnail_files = {}
-    for lang in ['en', 'es', 'fr', 'ur']:
-        thumb_path = f"assets/thumbnails/{lang}/{thumbnail_mapping[lang]}"
-        if os.path.exists(thumb_path):
+    for lang in LANGUAGES:
+        thumb_path = f"{thumb_dirs[lang]}/{thumbnail_mapping[lang]}"
+        if thumbnail_mapping[lang] in list_files(thumb_dirs[lang]):
             thumbnail_files[lang] = thumb_path
             print(f"✅ Thumb {lang.upper()}: {thumb_path}")
         else:
@@ -49,40 +61,20 @@ def setup_final_upload_system():
     upload_config = {
         'videos': video_files,
         'thumbnails': thumbnail_files,
-        'metadata': {
-            'en': {
-                'title': 'The Hidden Signs That Changed Everything',
-                'description': 'Discover how missing one opportunity can lead to finding your true path. This story explores how unexpected setbacks often contain hidden messages that guide us toward our authentic purpose.',
-                'tags': ['personal development', 'mindfulness', 'inspiration', 'life lessons', 'growth', 'motivation'],
-                'privacy': 'private'  # Start with private for testing
-            },
-            'es': {
-                'title': 'Las Señales Ocultas Que Lo Cambiaron Todo', 
-                'description': 'Descubre cómo perder una oportunidad puede llevarte a encontrar tu verdadero camino. Esta historia explora cómo los contratiempos inesperados contienen mensajes ocultos.',
-                'tags': ['desarrollo personal', 'mindfulness', 'inspiración', 'lecciones de vida', 'crecimiento'],
-                'privacy': 'private'
-            },
-            'fr': {
-                'title': 'Les Signes Cachés Qui Ont Tout Changé',
-                'description': 'Découvrez comment manquer une opportunité peut vous mener vers votre véritable chemin. Cette histoire explore comment les revers inattendus contiennent des messages cachés.',
-                'tags': ['développement personnel', 'pleine conscience', 'inspiration', 'leçons de vie', 'croissance'],
-                'privacy': 'private'
-            },
-            'ur': {
-                'title': 'چھپے ہوئے نشانات جنہوں نے سب کچھ بدل دیا',
-                'description': 'دریافت کریں کہ کیسے ایک موقع کھونا آپ کو اپنے اصل راستے کی طرف لے جا سکتا ہے۔ یہ کہانی بتاتی ہے کہ کیسے غیر متوقع رکاوٹوں میں چھپے ہوئے پیغامات ہوتے ہیں۔',
-                'tags': ['ذاتی ترقی', 'ذہن سازی', 'تحریک', 'زندگی کے اسباق', 'نمو'],
-                'privacy': 'private'
-            }
-        }
+        'metadata': load_json('config/upload_metadata.json')
     }
     
-    # Save configuration
-    import json
-    with open('config/upload_config.json', 'w', encoding='utf-8') as f:
-        json.dump(upload_config, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n✅ Created upload configuration: config/upload_config.json")
+    # Save configuration (skipped when nothing changed since the last run)
+    config_file = 'config/upload_config.json'
+    try:
+        unchanged = load_json(config_file) == upload_config
+    except (OSError, ValueError):
+        unchanged = False  # Missing or unreadable, so write it afresh
+    if unchanged:
+        print(f"\n✅ Upload configuration unchanged: {config_file}")
+    else:
+        save_json(upload_config, config_file)
+        print(f"\n✅ Created upload configuration: {config_file}")
     
     # Create final upload script
     upload_script = '''#!/usr/bin/env python3
@@ -93,16 +85,28 @@ Upload all videos with proper metadata and thumbnails
 
 import sys
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 sys.path.append('lib')
 sys.path.append('lib/video_tools')
 
+from jsonl_utils import append_jsonl, load_json, save_json
 from youtube_uploader import YouTubeUploader
 
 def load_upload_config():
     """Load upload configuration"""
-    with open('config/upload_config.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json('config/upload_config.json')
+
+def upload_one(lang, video_path, metadata):
+    """Upload one video on its own API client (the client isn't thread-safe)"""
+    uploader = YouTubeUploader()
+    if not uploader.authenticate():
+        return None
+    return uploader.upload_video(
+        video_path=video_path,
+        metadata=metadata,
+        language=lang
+    )
 
 def upload_all_videos():
     """Upload all production videos"""
@@ -113,15 +117,15 @@ def upload_all_videos():
     # Load configuration
     config = load_upload_config()
     
-    # Initialize uploader
+    # Authenticate once up front, so any token refresh or sign-in happens
+    # before the parallel uploads load the saved token
     uploader = YouTubeUploader()
-    
-    # Authenticate
     if not uploader.authenticate():
         print("❌ Authentication failed")
         return
     
     results = []
+    jobs = {}
     
     for lang in ['en', 'es', 'fr', 'ur']:
         if lang not in config['videos']:
@@ -142,22 +146,39 @@ def upload_all_videos():
         if thumbnail_path:
             print(f"🖼️ Thumbnail: {os.path.basename(thumbnail_path)}")
         
-        # Upload video
-        video_id = uploader.upload_video(
-            video_path=video_path,
-            metadata=metadata,
-            language=lang
-        )
-        
-        if video_id:
-            video_url = f"https://youtube.com/watch?v={video_id}"
-            print(f"✅ SUCCESS! {lang.upper()} uploaded: {video_url}")
-            results.append({
-                'language': lang,
-                'video_id': video_id,
-                'url': video_url,
-                'title': metadata['title']
-            })
+        jobs[lang] = (video_path, metadata)
+    
+    # Uploads are network-bound, so run them all at once. Each success is
+    # appended to the upload log as soon as it lands, so a crash part-way
+    # through doesn't lose track of videos that are already live
+    uploaded = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+        futures = {
+            executor.submit(upload_one, lang, video_path, metadata): lang
+            for lang, (video_path, metadata) in jobs.items()
+        }
+        for future in as_completed(futures):
+            lang = futures[future]
+            try:
+                video_id = future.result()
+            except Exception as e:
+                # One failed worker mustn't stop the other uploads being recorded
+                print(f"❌ {lang.upper()} upload raised an error: {e}")
+                continue
+            if video_id:
+                uploaded[lang] = {
+                    'language': lang,
+                    'video_id': video_id,
+                    'url': f"https://youtube.com/watch?v={video_id}",
+                    'title': jobs[lang][1]['title']
+                }
+                append_jsonl({**uploaded[lang], 'uploaded_at': datetime.now().isoformat()}, 'upload_results.jsonl')
+    
+    # Report in language order, whatever order the uploads finished in
+    for lang in jobs:
+        if lang in uploaded:
+            print(f"✅ SUCCESS! {lang.upper()} uploaded: {uploaded[lang]['url']}")
+            results.append(uploaded[lang])
         else:
             print(f"❌ Upload failed for {lang.upper()}")
     
@@ -173,8 +194,7 @@ def upload_all_videos():
             print(f"     🔗 {result['url']}")
     
     # Save results
-    with open('upload_results.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    save_json(results, 'upload_results.json')
     
     print(f"\\n📋 Results saved to: upload_results.json")
     
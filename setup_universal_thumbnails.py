@@ -4,7 +4,11 @@ Copy English thumbnail to other language directories for universal strategy
 """
 
 import os
-import shutil
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+from lib.file_utils import fast_clone, list_files
 
 def setup_universal_thumbnails():
     """Copy the English thumbnail to all language directories"""
@@ -32,7 +36,7 @@ def setup_universal_thumbnails():
         target_file = os.path.join(lang_dir, f"story_001_{lang}_thumbnail.png")
         
         try:
-            shutil.copy2(source_file, target_file)
+            fast_clone(source_file, target_file)
             print(f"✅ {lang.upper()}: Copied to {target_file}")
         except Exception as e:
             print(f"❌ {lang.upper()}: Failed to copy - {e}")
@@ -42,8 +46,9 @@ def setup_universal_thumbnails():
     
     # Verify all files exist
     for lang in ['en', 'es', 'fr', 'ur']:
-        thumbnail_path = os.path.join(base_dir, lang, f"story_001_{lang}_thumbnail.png")
-        if os.path.exists(thumbnail_path):
+        thumbnail_name = f"story_001_{lang}_thumbnail.png"
+        thumbnail_path = os.path.join(base_dir, lang, thumbnail_name)
+        if thumbnail_name in list_files(os.path.join(base_dir, lang)):
             print(f"  ✅ {lang.upper()}: {thumbnail_path}")
         else:
             print(f"  ❌ {lang.upper()}: Missing thumbnail")
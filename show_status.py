@@ -4,9 +4,15 @@ Show status overview of all videos in the tracker.
 Groups by story and shows status for each language.
 """
 
-import json
+import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+sys.path.append(str(Path(__file__).parent))
+from lib.jsonl_utils import load_json
+
+# Story numbers shown in the overview
+TRACKED_STORY_NUMBERS = frozenset(('004', '005', '006'))
 
 def show_status():
     """Display organized status overview."""
@@ -16,13 +22,17 @@ def show_status():
         print(f"❌ Error: Tracker file not found: {tracker_file}")
         return
     
-    with open(tracker_file, 'r', encoding='utf-8') as f:
-        tracker_data = json.load(f)
+    tracker_data = load_json(tracker_file)
     
-    # Group by story number (004, 005, 006) and type
+    # Group by story number (004, 005, 006) and type, counting statuses
+    # in the same pass over the tracker
     stories = defaultdict(lambda: {'main': {}, 'shorts': []})
+    status_counts = Counter()
     
     for video_id, video in tracker_data.items():
+        if video.get('video_id', '')[:3] in TRACKED_STORY_NUMBERS:
+            status_counts[video.get('status')] += 1
+        
         # Skip old entries
         if 'story_id' in video and 'seeing' in video.get('story_id', ''):
             continue
@@ -30,15 +40,8 @@ def show_status():
             continue
         
         # Extract story number
-        story_num = None
-        if video_id.startswith('004'):
-            story_num = '004'
-        elif video_id.startswith('005'):
-            story_num = '005'
-        elif video_id.startswith('006'):
-            story_num = '006'
-        
-        if not story_num:
+        story_num = video_id[:3]
+        if story_num not in TRACKED_STORY_NUMBERS:
             continue
         
         video_type = video.get('type', 'main')
@@ -60,8 +63,8 @@ def show_status():
                 'file_size_mb': video.get('file_size_mb', 'N/A')
             }
     
-    print("\n📊 VIDEO STATUS OVERVIEW")
-    print("=" * 100)
+    # Collect the report and write it in one go
+    lines = ["\n📊 VIDEO STATUS OVERVIEW", "=" * 100]
     
     # Define characters
     characters = {
@@ -82,30 +85,30 @@ def show_status():
         story_data = stories[story_num]
         character = characters.get(story_num, 'Unknown')
         
-        print(f"\n{'─' * 100}")
-        print(f"📺 STORY {story_num}: {character}")
-        print(f"{'─' * 100}")
+        lines.append(f"\n{'─' * 100}")
+        lines.append(f"📺 STORY {story_num}: {character}")
+        lines.append(f"{'─' * 100}")
         
         # Main story
-        print(f"\n🎬 Main Story:")
+        lines.append(f"\n🎬 Main Story:")
         if story_data['main']:
-            title = list(story_data['main'].values())[0]['title']
-            print(f"   Title: {title}")
-            print(f"   Languages:")
+            title = next(iter(story_data['main'].values()))['title']
+            lines.append(f"   Title: {title}")
+            lines.append(f"   Languages:")
             for lang in ['en', 'hi', 'es', 'fr', 'ur']:
                 if lang in story_data['main']:
                     video = story_data['main'][lang]
                     status = video['status']
                     emoji = status_emoji.get(status, '❓')
                     size = f" ({video['file_size_mb']} MB)" if video.get('file_size_mb') != 'N/A' else ""
-                    print(f"      {emoji} {lang.upper()}: {status}{size}")
+                    lines.append(f"      {emoji} {lang.upper()}: {status}{size}")
                 else:
-                    print(f"      ⚪ {lang.upper()}: not tracked")
+                    lines.append(f"      ⚪ {lang.upper()}: not tracked")
         else:
-            print(f"   No main story videos")
+            lines.append(f"   No main story videos")
         
         # Shorts
-        print(f"\n📱 Shorts (English only):")
+        lines.append(f"\n📱 Shorts (English only):")
         if story_data['shorts']:
             shorts_by_type = {}
             for short in story_data['shorts']:
@@ -119,34 +122,30 @@ def show_status():
                     for short in shorts_by_type[short_type]:
                         status = short['status']
                         emoji = status_emoji.get(status, '❓')
-                        print(f"      {emoji} {short_type.title()}: {short['title'][:50]}... ({status})")
+                        lines.append(f"      {emoji} {short_type.title()}: {short['title'][:50]}... ({status})")
         else:
-            print(f"   No shorts")
+            lines.append(f"   No shorts")
     
-    print(f"\n{'=' * 100}")
+    lines.append(f"\n{'=' * 100}")
     
     # Summary counts
-    total_published = sum(1 for v in tracker_data.values() 
-                         if v.get('status') == 'published' and 
-                         (v.get('video_id', '').startswith(('004', '005', '006'))))
-    total_ready = sum(1 for v in tracker_data.values() 
-                     if v.get('status') == 'video_ready' and 
-                     (v.get('video_id', '').startswith(('004', '005', '006'))))
-    total_script = sum(1 for v in tracker_data.values() 
-                      if v.get('status') == 'script_ready' and 
-                      (v.get('video_id', '').startswith(('004', '005', '006'))))
+    total_published = status_counts['published']
+    total_ready = status_counts['video_ready']
+    total_script = status_counts['script_ready']
     
-    print(f"\n📈 SUMMARY:")
-    print(f"   ✅ Published: {total_published}")
-    print(f"   📹 Video Ready: {total_ready}")
-    print(f"   📝 Script Ready: {total_script}")
-    print(f"   Total tracked: {total_published + total_ready + total_script}")
-    print(f"\n{'=' * 100}\n")
+    lines.append(f"\n📈 SUMMARY:")
+    lines.append(f"   ✅ Published: {total_published}")
+    lines.append(f"   📹 Video Ready: {total_ready}")
+    lines.append(f"   📝 Script Ready: {total_script}")
+    lines.append(f"   Total tracked: {total_published + total_ready + total_script}")
+    lines.append(f"\n{'=' * 100}\n")
     
     # Legend
-    print("Legend:")
-    print("  ✅ Published  📹 Video Ready  📝 Script Ready  ⚪ Not Tracked")
-    print()
+    lines.append("Legend:")
+    lines.append("  ✅ Published  📹 Video Ready  📝 Script Ready  ⚪ Not Tracked")
+    lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     show_status()
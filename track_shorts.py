@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """
 Simplified shorts tracker - track most recent shorts
-Usage: python track_shorts_simple.py
+Usage: python track_shorts_simple.py [story_number] [--force]
+
+Passing a story number (e.g. 008) only lists that story's shorts and
+skips the story number prompt.
 """
 
-import json
+import heapq
+import os
+import re
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -12,61 +17,87 @@ import sys
 sys.path.append(str(Path(__file__).parent))
 from config.paths import VIDEO_TRACKER_FILE, STORY_DIRS
 from lib.story_utils import load_story
+from lib.jsonl_utils import load_json, save_json
+
+SHORT_TYPE_PATTERN = re.compile(r'_short_([a-z]+)')
+SHORT_TITLE_PATTERN = re.compile(r'\*\*SHORT TITLE\*\*:(.*)')
 
 def extract_short_title(short_content: str) -> str:
     """Extract title from short script."""
-    lines = short_content.split('\n')
-    for line in lines:
-        if '**SHORT TITLE**:' in line:
-            return line.split('**SHORT TITLE**:')[1].strip().strip('"')
+    match = SHORT_TITLE_PATTERN.search(short_content)
+    if match:
+        return match.group(1).strip().strip('"')
     return "Untitled Short"
 
+force = '--force' in sys.argv[1:]
+story_arg = next((arg for arg in sys.argv[1:] if not arg.startswith('--')), None)
+
 # Load tracker
-with open(VIDEO_TRACKER_FILE, 'r', encoding='utf-8') as f:
-    tracker_data = json.load(f)
+tracker_data = load_json(VIDEO_TRACKER_FILE)
 
 # Find all shorts
 shorts_dir = STORY_DIRS['youtube_optimized'].parent / "shorts"
-all_shorts = sorted(shorts_dir.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
+with os.scandir(shorts_dir) as entries:
+    # Filter on names first so unrelated files are never stat'ed
+    name_prefix = f"{story_arg}_" if story_arg else ""
+    all_shorts = [entry for entry in entries
+                  if entry.name.endswith('.json') and entry.name.startswith(name_prefix) and entry.is_file()]
+
+# Only the five most recent are offered, so there's no need to sort them all
+recent_shorts = heapq.nlargest(5, all_shorts, key=lambda entry: entry.stat().st_mtime)
 
 print("📺 TRACK RECENT SHORTS")
 print("=" * 70)
 print(f"Found {len(all_shorts)} total shorts\n")
 
 # Show recent shorts and ask to track
-for i, short_file in enumerate(all_shorts[:5], 1):
-    short_data = load_story(short_file)
+loaded_shorts = {}
+short_titles = {}
+for i, short_file in enumerate(recent_shorts, 1):
+    short_data = load_story(short_file.path)
+    loaded_shorts[short_file.path] = short_data
     if short_data:
         title = extract_short_title(short_data.get('short_content', ''))
+        short_titles[short_file.path] = title
         short_type = short_data.get('short_type', 'unknown')
         print(f"{i}. [{short_type.upper()}] {title}")
         print(f"   File: {short_file.name}")
 
-choice = input(f"\nTrack which shorts? (1-{min(5, len(all_shorts))}, 'all', or 'q' to quit): ").strip().lower()
+choice = input(f"\nTrack which shorts? (1-{len(recent_shorts)}, 'all', or 'q' to quit): ").strip().lower()
 
 if choice == 'q':
     print("Cancelled")
     sys.exit(0)
 
 if choice == 'all':
-    shorts_to_track = all_shorts[:5]
+    shorts_to_track = recent_shorts
 else:
     try:
         idx = int(choice) - 1
-        shorts_to_track = [all_shorts[idx]]
+        if not 0 <= idx < len(recent_shorts):
+            raise IndexError(idx)
+        shorts_to_track = [recent_shorts[idx]]
     except:
         print("Invalid choice")
         sys.exit(1)
 
 # Get story number
-story_num = input("Enter story number for these shorts (e.g., 006): ").strip()
+story_num = story_arg or input("Enter story number for these shorts (e.g., 006): ").strip()
 
-# Track them
+# Track them (one timestamp for the whole batch)
+tracked_count = 0
+now = datetime.now().isoformat()
 for short_file in shorts_to_track:
-    short_data = load_story(short_file)
+    # Skip shorts already in the tracker without re-reading their files
+    type_match = SHORT_TYPE_PATTERN.search(short_file.name)
+    if type_match and f"{story_num}_short_{type_match.group(1)}" in tracker_data and not force:
+        print(f"\n⏭️  Already tracked: {story_num}_short_{type_match.group(1)} (use --force to update)")
+        continue
+    
+    short_data = loaded_shorts[short_file.path]
     if short_data:
         short_type = short_data.get('short_type', 'unknown')
-        title = extract_short_title(short_data.get('short_content', ''))
+        title = short_titles[short_file.path]
         
         video_id = f"{story_num}_short_{short_type}"
         
@@ -77,19 +108,23 @@ for short_file in shorts_to_track:
             "format": "vertical_9_16",
             "parent_video": f"{story_num}_en",
             "short_type": short_type,
-            "short_file": str(short_file),
+            "short_file": short_file.path,
             "language": "en",
             "status": "script_ready",
-            "created_at": datetime.now().isoformat(),
+            "created_at": now,
             "estimated_duration": "30-60 seconds",
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now
         }
         
+        tracked_count += 1
         print(f"\n✅ Tracked: {video_id}")
         print(f"   {title}")
 
+if not tracked_count:
+    print("\nNothing new to track")
+    sys.exit(0)
+
 # Save
-with open(VIDEO_TRACKER_FILE, 'w', encoding='utf-8') as f:
-    json.dump(tracker_data, f, indent=2, ensure_ascii=False)
+save_json(tracker_data, VIDEO_TRACKER_FILE, pretty=False)
 
 print(f"\n✅ Saved to tracker")
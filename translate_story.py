@@ -4,29 +4,59 @@ Universal Translation Script - Works for ANY story
 Translates story to Spanish, French, and Hinglish
 
 Usage:
-    python translate_story.py <story_id>
+    python translate_story.py <story_id> [--no-cache] [--force]
     python translate_story.py youtube_optimized_learning_1_1_b9b9bc1f_2d15ef3d
+
+Languages whose translated file is newer than the source story are skipped;
+pass --force to translate them again. Translations are also cached under
+.cache/translations by prompt, so re-running on an unchanged story costs
+nothing. Pass --no-cache to translate afresh.
 """
 
-import json
+import hashlib
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 # Add lib to path
 sys.path.append(str(Path(__file__).parent / "lib"))
-from llm_tools import create_default_manager
+from llm_tools import get_default_manager
 
 # Import centralized utilities
 sys.path.append(str(Path(__file__).parent))
-from config.paths import LANGUAGES, ACTIVE_LANGUAGES, STORY_DIRS
-from lib.story_utils import find_story, save_story, generate_story_filename, extract_character_info
+from config.paths import LANGUAGES, ACTIVE_LANGUAGES, STORY_DIRS, TRANSLATION_CACHE_DIR
+from lib.jsonl_utils import load_json, save_json
+from lib.story_utils import find_story, save_story, generate_story_filename
 
-def translate_content(content, target_language, language_name):
-    """Translate content to target language."""
-    
-    if target_language == 'hi':  # Hinglish
-        prompt = f"""Translate into HINGLISH (Hindi in Roman/Latin script mixed with English).
+# Reply budget for translation calls. create_default_manager's 1000-token
+# default can't hold a translated story plus its metadata, so translation
+# requests raise it to the models' output limit, with a longer timeout
+# since such replies take a while to generate
+TRANSLATION_MAX_TOKENS = 4096
+TRANSLATION_TIMEOUT = 120
+# Rough characters per token, and how much longer a translation may run
+# than its source (Hinglish and accented text tokenise less densely)
+CHARS_PER_TOKEN = 4
+TRANSLATION_GROWTH = 1.5
+# Longest source text whose translation still fits in a single reply. It
+# bounds the fused story + metadata call, and paragraph chunks are sized
+# from the same budget so chunking only kicks in for content that could
+# not come back in one reply anyway. Fewer, longer calls cost the same
+# tokens but send the rules once and take longer per call; a reply cut
+# off at the limit fails the marker check and is redone per part
+MAX_REPLY_SOURCE_CHARS = int(TRANSLATION_MAX_TOKENS * CHARS_PER_TOKEN / TRANSLATION_GROWTH)
+MAX_CHUNK_CHARS = MAX_REPLY_SOURCE_CHARS
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+STORY_MARKER = "===STORY==="
+METADATA_MARKER = "===METADATA==="
+END_MARKER = "===END==="
+
+# Fixed instructions always come before the content, so every prompt for a
+# language shares a byte-identical prefix that providers can cache
+HINGLISH_RULES = """Translate into HINGLISH (Hindi in Roman/Latin script mixed with English).
 
 HINGLISH RULES:
 - Write Hindi words using English alphabet only
@@ -35,35 +65,177 @@ HINGLISH RULES:
 - Use conversational tone
 - NO Devanagari script - only Roman letters
 
-Content to translate:
-{content}
-
 Translate while maintaining emotional impact and natural flow."""
-    else:
-        prompt = f"""Translate into {language_name}.
 
-Content to translate:
-{content}
+GENERIC_RULES = """Translate into {language_name}.
 
 Translate while maintaining:
 - Emotional impact
 - Natural flow
 - Cultural appropriateness"""
+
+BUNDLE_RULES = f"Keep the {STORY_MARKER}, {METADATA_MARKER} and {END_MARKER} lines exactly as they are and translate the text between them."
+
+def translation_cache_key(prompt):
+    """Hash a prompt for the translation cache.
+    
+    Line endings and trailing whitespace are normalised first, so a story
+    re-saved by another editor still hits the cache.
+    """
+    normalized = "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def generate_cached(prompt, use_cache=True, is_valid=None):
+    """Run a prompt through the LLM, reusing the reply to an equivalent earlier prompt.
+    
+    Returns (content, cost); cache hits cost nothing. If is_valid is given,
+    only replies it accepts are stored or replayed from the cache.
+    """
+    cache_file = TRANSLATION_CACHE_DIR / f"{translation_cache_key(prompt)}.json"
+    if use_cache:
+        try:
+            content = load_json(cache_file)['content']
+            if is_valid is None or is_valid(content):
+                return content, 0.0
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    response = get_default_manager().generate(
+        prompt=prompt, max_tokens=TRANSLATION_MAX_TOKENS, timeout=TRANSLATION_TIMEOUT
+    )
+    
+    if is_valid is None or is_valid(response.content):
+        try:
+            TRANSLATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            save_json({'content': response.content}, cache_file)
+        except OSError:
+            pass  # Caching is best-effort
     
-    llm = create_default_manager()
-    response = llm.generate(prompt=prompt)
     return response.content, response.cost_estimate
 
+def split_into_chunks(content, max_chars=MAX_CHUNK_CHARS):
+    """Split content on paragraph breaks into chunks of at most max_chars.
+    
+    A single paragraph longer than max_chars becomes a chunk of its own.
+    """
+    chunks = []
+    current = ""
+    for paragraph in PARAGRAPH_BREAK.split(content):
+        if current and len(current) + 2 + len(paragraph) > max_chars:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+def translate_parts(parts, target_language, language_name, use_cache=True):
+    """Translate several pieces of content, returning [(text, cost), ...].
+    
+    A part too long for one reply is split into paragraph chunks; with
+    current stories each part is a single chunk. Every chunk of every part
+    is translated concurrently and the chunks are rejoined per part, so
+    the wall time is one round trip.
+    """
+    chunked = [split_into_chunks(part) or [part] for part in parts]
+    jobs = [chunk for chunks in chunked for chunk in chunks]
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        results = iter(list(executor.map(
+            lambda chunk: generate_cached(build_translation_prompt(chunk, target_language, language_name), use_cache),
+            jobs
+        )))
+    
+    translated = []
+    for chunks in chunked:
+        pieces = [next(results) for _ in chunks]
+        translated.append(("\n\n".join(text.strip() for text, _ in pieces), sum(cost for _, cost in pieces)))
+    return translated
+
+def translate_content(content, target_language, language_name, use_cache=True):
+    """Translate content to target language (in concurrent chunks if long)."""
+    return translate_parts([content], target_language, language_name, use_cache)[0]
+
+def split_bundle(translated):
+    """Split a bundled reply into (story, metadata).
+    
+    Returns None unless the story, metadata and end markers all appear,
+    in that order.
+    """
+    story_at = translated.find(STORY_MARKER)
+    metadata_at = translated.find(METADATA_MARKER, story_at + len(STORY_MARKER)) if story_at >= 0 else -1
+    end_at = translated.find(END_MARKER, metadata_at + len(METADATA_MARKER)) if metadata_at >= 0 else -1
+    if end_at < 0:
+        return None
+    return (translated[story_at + len(STORY_MARKER):metadata_at].strip(),
+            translated[metadata_at + len(METADATA_MARKER):end_at].strip())
+
+def translate_story_bundle(story_content, metadata_content, target_language, language_name, use_cache=True):
+    """Translate story and metadata together in a single LLM call.
+    
+    A bundle whose translation wouldn't fit in one reply is instead
+    translated per part, with story and metadata chunks all running
+    concurrently. The same happens if the response doesn't keep the
+    section markers intact.
+    """
+    bundle_cost = 0.0
+    bundle = f"{STORY_MARKER}\n{story_content}\n{METADATA_MARKER}\n{metadata_content}\n{END_MARKER}"
+    if len(bundle) <= MAX_REPLY_SOURCE_CHARS:
+        prompt = build_translation_prompt(bundle, target_language, language_name, BUNDLE_RULES)
+        
+        # Only a reply with intact markers is cached, so a garbled one is
+        # retried on the next run instead of being replayed
+        translated, bundle_cost = generate_cached(prompt, use_cache, is_valid=lambda text: split_bundle(text) is not None)
+        
+        parts = split_bundle(translated)
+        if parts:
+            return parts[0], parts[1], bundle_cost
+    
+    (story_translated, story_cost), (metadata_translated, metadata_cost) = translate_parts(
+        [story_content, metadata_content], target_language, language_name, use_cache
+    )
+    return story_translated, metadata_translated, bundle_cost + story_cost + metadata_cost
+
+def build_translation_prompt(content, target_language, language_name, extra_rules=None):
+    """Build the translation prompt for a target language.
+    
+    Rules (plus any extra_rules) form a static prefix; only the trailing
+    content varies between calls.
+    """
+    rules = HINGLISH_RULES if target_language == 'hi' else GENERIC_RULES.format(language_name=language_name)
+    if extra_rules:
+        rules = f"{rules}\n\n{extra_rules}"
+    return f"{rules}\n\nContent to translate:\n{content}"
+
+def numbered_name_parts(story_file, story_data):
+    """Return (story_number, character, occupation) if the story follows the
+    numbered naming convention (e.g. 007_josh_painter_story_en), else None."""
+    # Taken from the source file name first, then from the story's own ID
+    for name in (Path(story_file).stem, story_data.get('id', '')):
+        parts = name.split('_')
+        if len(parts) >= 4 and parts[0].isdigit():
+            return parts[0], parts[1], parts[2]
+    return None
+
+def translated_story_filename(name_parts, base_id, lang_code):
+    """Pick the output filename for a translated story."""
+    if name_parts:
+        return generate_story_filename(*name_parts, lang_code)
+    return f"{base_id}_{lang_code}.json"
+
 def main():
     if len(sys.argv) < 2:
         print("❌ Error: Please provide story ID")
         print("\nUsage:")
-        print("  python translate_story.py <story_id>")
+        print("  python translate_story.py <story_id> [--no-cache] [--force]")
         print("\nExample:")
         print("  python translate_story.py youtube_optimized_learning_1_1_b9b9bc1f_2d15ef3d")
         sys.exit(1)
     
     story_id = sys.argv[1]
+    use_cache = '--no-cache' not in sys.argv[2:]
+    force = '--force' in sys.argv[2:]
     
     print("🌍 UNIVERSAL STORY TRANSLATOR")
     print(f"Story ID: {story_id}")
@@ -86,27 +258,73 @@ def main():
     # Use active languages from config (excluding English)
     languages = {lang: LANGUAGES[lang]['name'] for lang in ACTIVE_LANGUAGES if lang != 'en'}
     
+    # Output naming depends only on the source story, so work it out once;
+    # without a numbered name, fall back to the story's ID, then the input ID
+    name_parts = numbered_name_parts(story_file, story_data)
+    base_id = story_data.get('id', story_id)
+    output_files = {
+        lang_code: STORY_DIRS[lang_code] / translated_story_filename(name_parts, base_id, lang_code)
+        for lang_code in languages
+    }
+    
+    # Skip languages already translated since the source last changed,
+    # so a re-run after a partial failure only redoes what's missing
+    skipped = []
+    if not force:
+        source_mtime = Path(story_file).stat().st_mtime
+        for lang_code in list(languages):
+            output_file = output_files[lang_code]
+            if output_file.exists() and output_file.stat().st_mtime > source_mtime:
+                skipped.append(languages.pop(lang_code))
+        if skipped:
+            print(f"\n⏭️  Already translated (use --force to redo): {', '.join(skipped)}")
+    
+    if not languages:
+        print(f"\n✅ All languages already translated")
+        return
+    
     total_cost = 0.0
     
+    # Create the shared LLM manager up front, before any worker threads
+    try:
+        get_default_manager()
+    except Exception as e:
+        print(f"❌ LLM setup failed: {e}")
+        sys.exit(1)
+    
+    # Each language is an independent LLM round-trip, so request them all
+    # at once; story and metadata share one call per language
+    print(f"\n⏳ Translating into {len(languages)} languages...")
+    with ThreadPoolExecutor(max_workers=max(1, len(languages))) as executor:
+        if metadata_content:
+            futures = {
+                lang_code: executor.submit(translate_story_bundle, story_content, metadata_content, lang_code, lang_name, use_cache)
+                for lang_code, lang_name in languages.items()
+            }
+        else:
+            futures = {
+                lang_code: executor.submit(translate_content, story_content, lang_code, lang_name, use_cache)
+                for lang_code, lang_name in languages.items()
+            }
+    
+    translated_count = 0
+    translated_at = datetime.now().isoformat()
     for lang_code, lang_name in languages.items():
         print(f"\n{'='*70}")
         print(f"🌍 {lang_name.upper()}")
         print(f"{'='*70}")
         
-        # Translate main content
-        print(f"   ⏳ Translating story...")
-        story_translated, story_cost = translate_content(story_content, lang_code, lang_name)
-        print(f"   ✅ Story (${story_cost:.4f})")
-        
-        # Translate metadata if exists
-        metadata_translated = ""
-        metadata_cost = 0.0
-        if metadata_content:
-            print(f"   ⏳ Translating metadata...")
-            metadata_translated, metadata_cost = translate_content(metadata_content, lang_code, lang_name)
-            print(f"   ✅ Metadata (${metadata_cost:.4f})")
+        try:
+            if metadata_content:
+                story_translated, metadata_translated, lang_total = futures[lang_code].result()
+            else:
+                story_translated, lang_total = futures[lang_code].result()
+                metadata_translated = ""
+        except Exception as e:
+            print(f"   ❌ Translation failed: {e}")
+            continue
+        print(f"   ✅ Story{' + metadata' if metadata_content else ''}")
         
-        lang_total = story_cost + metadata_cost
         total_cost += lang_total
         print(f"   💰 Total: ${lang_total:.4f}")
         
@@ -119,45 +337,20 @@ def main():
             "language": lang_code,
             "language_name": lang_name,
             "translation_cost": lang_total,
-            "translated_at": datetime.now().isoformat()
+            "translated_at": translated_at
         }
         
         # Save using utility functions
-        output_dir = STORY_DIRS[lang_code]
-        
-        # Generate new-style filename
-        # Try to extract story number from the story file name first
-        story_filename = Path(story_file).stem  # e.g., "007_josh_painter_story_en"
-        story_id_parts = story_filename.split('_')
-        
-        if len(story_id_parts) >= 4 and story_id_parts[0].isdigit():
-            # New format: 007_josh_painter_story_en
-            story_num = story_id_parts[0]
-            character = story_id_parts[1]
-            occupation = story_id_parts[2]
-            filename = f"{story_num}_{character}_{occupation}_story_{lang_code}.json"
-        elif 'id' in story_data:
-            # Try from story data ID
-            story_id_parts = story_data['id'].split('_')
-            if len(story_id_parts) >= 4 and story_id_parts[0].isdigit():
-                story_num = story_id_parts[0]
-                character = story_id_parts[1]
-                occupation = story_id_parts[2]
-                filename = f"{story_num}_{character}_{occupation}_story_{lang_code}.json"
-            else:
-                # Generate from story_id
-                filename = f"{story_data['id']}_{lang_code}.json"
-        else:
-            # Last resort - use story_id from input
-            filename = f"{story_id}_{lang_code}.json"
-        
-        output_file = output_dir / filename
+        output_file = output_files[lang_code]
         save_story(output_file, translated_data)
         
+        translated_count += 1
         print(f"   💾 {output_file}")
     
     print(f"\n{'='*70}")
-    print(f"✅ Translated to {len(languages)} languages")
+    print(f"✅ Translated to {translated_count}/{len(languages)} languages")
+    if skipped:
+        print(f"⏭️  Skipped (already translated): {', '.join(skipped)}")
     print(f"💰 Total cost: ${total_cost:.4f}")
     print(f"{'='*70}")
 
@@ -6,16 +6,28 @@ Upload all videos with proper metadata and thumbnails
 
 import sys
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 sys.path.append('lib')
 sys.path.append('lib/video_tools')
 
+from jsonl_utils import append_jsonl, load_json, save_json
 from youtube_uploader import YouTubeUploader
 
 def load_upload_config():
     """Load upload configuration"""
-    with open('config/upload_config.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json('config/upload_config.json')
+
+def upload_one(lang, video_path, metadata):
+    """Upload one video on its own API client (the client isn't thread-safe)"""
+    uploader = YouTubeUploader()
+    if not uploader.authenticate():
+        return None
+    return uploader.upload_video(
+        video_path=video_path,
+        metadata=metadata,
+        language=lang
+    )
 
 def upload_all_videos():
     """Upload all production videos"""
@@ -26,15 +38,15 @@ def upload_all_videos():
     # Load configuration
     config = load_upload_config()
     
-    # Initialize uploader
+    # Authenticate once up front, so any token refresh or sign-in happens
+    # before the parallel uploads load the saved token
     uploader = YouTubeUploader()
-    
-    # Authenticate
     if not uploader.authenticate():
         print("❌ Authentication failed")
         return
     
     results = []
+    jobs = {}
     
     for lang in ['en', 'es', 'fr', 'ur']:
         if lang not in config['videos']:
@@ -55,22 +67,39 @@ def upload_all_videos():
         if thumbnail_path:
             print(f"🖼️ Thumbnail: {os.path.basename(thumbnail_path)}")
         
-        # Upload video
-        video_id = uploader.upload_video(
-            video_path=video_path,
-            metadata=metadata,
-            language=lang
-        )
-        
-        if video_id:
-            video_url = f"https://youtube.com/watch?v={video_id}"
-            print(f"✅ SUCCESS! {lang.upper()} uploaded: {video_url}")
-            results.append({
-                'language': lang,
-                'video_id': video_id,
-                'url': video_url,
-                'title': metadata['title']
-            })
+        jobs[lang] = (video_path, metadata)
+    
+    # Uploads are network-bound, so run them all at once. Each success is
+    # appended to the upload log as soon as it lands, so a crash part-way
+    # through doesn't lose track of videos that are already live
+    uploaded = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+        futures = {
+            executor.submit(upload_one, lang, video_path, metadata): lang
+            for lang, (video_path, metadata) in jobs.items()
+        }
+        for future in as_completed(futures):
+            lang = futures[future]
+            try:
+                video_id = future.result()
+            except Exception as e:
+                # One failed worker mustn't stop the other uploads being recorded
+                print(f"❌ {lang.upper()} upload raised an error: {e}")
+                continue
+            if video_id:
+                uploaded[lang] = {
+                    'language': lang,
+                    'video_id': video_id,
+                    'url': f"https://youtube.com/watch?v={video_id}",
+                    'title': jobs[lang][1]['title']
+                }
+                append_jsonl({**uploaded[lang], 'uploaded_at': datetime.now().isoformat()}, 'upload_results.jsonl')
+    
+    # Report in language order, whatever order the uploads finished in
+    for lang in jobs:
+        if lang in uploaded:
+            print(f"✅ SUCCESS! {lang.upper()} uploaded: {uploaded[lang]['url']}")
+            results.append(uploaded[lang])
         else:
             print(f"❌ Upload failed for {lang.upper()}")
     
@@ -86,8 +115,7 @@ def upload_all_videos():
             print(f"     🔗 {result['url']}")
     
     # Save results
-    with open('upload_results.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    save_json(results, 'upload_results.json')
     
     print(f"\n📋 Results saved to: upload_results.json")
     